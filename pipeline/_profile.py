@@ -0,0 +1,81 @@
+"""
+Optional cProfile instrumentation for the transcription pipeline.
+
+Functions decorated with @profiled(name), or called through profile_call(),
+run under cProfile when config.PROFILE_MERGE is enabled and dump their
+statistics to profile_<name>.pstats; otherwise they run untouched.
+"""
+
+import cProfile
+import functools
+import inspect
+from pathlib import Path
+
+import config
+
+# Only one cProfile profiler can be active at a time, so nested profiled
+# calls run inside the outer profile instead of starting their own
+_active = False
+
+
+def _stats_dir(signature: inspect.Signature, args: tuple, kwargs: dict) -> Path:
+    """Directory for the stats file: the call's output_dir or output_file's parent."""
+    bound = signature.bind_partial(*args, **kwargs).arguments
+    if bound.get('output_dir') is not None:
+        return Path(bound['output_dir'])
+    if bound.get('output_file') is not None:
+        return Path(bound['output_file']).parent
+    return Path.cwd()
+
+
+def profile_call(name: str, stats_dir: Path, func, *args, **kwargs):
+    """
+    Call a function, under cProfile when config.PROFILE_MERGE is set.
+
+    Args:
+        name: Name used for the stats file (profile_<name>.pstats)
+        stats_dir: Directory to write the stats file to
+        func: Function to call with the remaining arguments
+
+    Returns:
+        The function's return value
+    """
+    global _active
+    if not config.PROFILE_MERGE or _active:
+        return func(*args, **kwargs)
+
+    profile = cProfile.Profile()
+    _active = True
+    try:
+        return profile.runcall(func, *args, **kwargs)
+    finally:
+        _active = False
+        stats_file = Path(stats_dir) / f"profile_{name}.pstats"
+        profile.dump_stats(str(stats_file))
+        print(f"  Profile written to: {stats_file}")
+
+
+def profiled(name: str):
+    """
+    Decorator profiling each call of a function when config.PROFILE_MERGE is set.
+
+    The stats file goes to the call's output_dir or output_file's parent.
+
+    Args:
+        name: Name used for the stats file (profile_<name>.pstats)
+
+    Returns:
+        Decorator for the function to profile
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not config.PROFILE_MERGE or _active:
+                return func(*args, **kwargs)
+            return profile_call(name, _stats_dir(signature, args, kwargs),
+                                func, *args, **kwargs)
+
+        return wrapper
+    return decorator
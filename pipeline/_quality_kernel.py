@@ -0,0 +1,71 @@
+"""
+Numeric core of the segment quality analysis.
+
+Compiled with Numba when it is installed; otherwise an equivalent NumPy
+implementation is used, so Numba stays an optional speed-up. Numba is only
+imported, and the kernel only compiled, on the first get_kernel() call, so
+importing this module stays cheap.
+"""
+
+import math
+
+import numpy as np
+
+
+def _kernel_numpy(cr: np.ndarray, nsp: np.ndarray, lp: np.ndarray,
+                  cr_thr: float, nsp_thr: float, conf_thr: float):
+    """Vectorized equivalent of _kernel_loop(), used when Numba is not available."""
+    confident = lp > -10.0
+    conf = np.where(confident, np.exp(np.where(confident, lp, 0.0)), 0.0)
+    return conf, cr > cr_thr, nsp > nsp_thr, lp < conf_thr
+
+
+def _kernel_loop(cr, nsp, lp, cr_thr, nsp_thr, conf_thr):
+    """
+    Compute per-segment confidence and quality masks.
+
+    Args:
+        cr: Compression ratios (float64 array)
+        nsp: No-speech probabilities (float64 array)
+        lp: Average log probabilities (float64 array)
+        cr_thr: Hallucination threshold for the compression ratio
+        nsp_thr: Silence threshold for the no-speech probability
+        conf_thr: Low-confidence threshold for the average log probability
+
+    Returns:
+        Tuple of (confidence, likely_hallucination, likely_silence, low_confidence)
+    """
+    n = cr.shape[0]
+    conf = np.empty(n)
+    hall = np.empty(n, np.bool_)
+    sil = np.empty(n, np.bool_)
+    low = np.empty(n, np.bool_)
+    for i in range(n):
+        conf[i] = math.exp(lp[i]) if lp[i] > -10.0 else 0.0
+        hall[i] = cr[i] > cr_thr
+        sil[i] = nsp[i] > nsp_thr
+        low[i] = lp[i] < conf_thr
+    return conf, hall, sil, low
+
+
+# Kernel resolved by get_kernel() on first use
+_kernel = None
+
+
+def get_kernel():
+    """
+    Get the quality kernel, compiling it with Numba on the first call.
+
+    Returns:
+        kernel(cr, nsp, lp, cr_thr, nsp_thr, conf_thr) -> (conf, hall, sil, low)
+    """
+    global _kernel
+    if _kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # Optional: falls back to the NumPy implementation
+            _kernel = _kernel_numpy
+        else:
+            # cache=True keeps the compiled code on disk, keyed by the function's bytecode
+            _kernel = njit(cache=True)(_kernel_loop)
+    return _kernel
@@ -6,6 +6,9 @@ Modify these settings to customize the pipeline behavior.
 """
 
 import os
+import shutil
+import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 # ============================================================================
@@ -13,7 +16,8 @@ from pathlib import Path
 # ============================================================================
 
 # Base directory (project root) - used for models storage only
-BASE_DIR = Path(__file__).parent.parent.absolute()
+# (plain os.path string math; one Path object is built from the result)
+BASE_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Models: Whisper model storage (global location)
 MODELS_DIR = BASE_DIR / "models"
@@ -22,6 +26,10 @@ MODELS_DIR = BASE_DIR / "models"
 # This will be created inside each session folder during processing
 PROCESSED_DIR_NAME = "processed_audio"
 
+# Sidecar written into the processed audio directory with each file's
+# duration, so later stages can skip probing the audio with ffprobe
+DURATIONS_FILE_NAME = "durations.json"
+
 # Output: Transcripts directory name (created per session)
 # This will be created inside each session folder for outputs
 OUTPUT_DIR_NAME = "transcripts"
@@ -49,6 +57,12 @@ TASK = "transcribe"
 # Verbose output from Whisper
 VERBOSE = False
 
+# Recordings longer than this are transcribed in consecutive windows of about
+# this many seconds, cut at quiet points, so the spectrogram held in memory
+# stays bounded. Splitting can change the transcript near the cuts
+# (None = never split)
+MAX_CLIP_SECONDS = None
+
 # ============================================================================
 # QUALITY DETECTION SETTINGS
 # ============================================================================
@@ -84,6 +98,12 @@ TARGET_BIT_DEPTH = 16
 # Audio normalization (loudness normalization for consistent volume)
 NORMALIZE_AUDIO = True
 
+# Normalization filter used when NORMALIZE_AUDIO is enabled:
+#   "loudnorm"   = EBU R128 loudness normalization (default)
+#   "dynaudnorm" = Dynamic range normalizer, ~3x cheaper on CPU and equally
+#                  suited to speech transcription
+NORMALIZE_MODE = "loudnorm"
+
 # FFmpeg executable (usually just "ffmpeg" if on PATH)
 FFMPEG_EXECUTABLE = "ffmpeg"
 
@@ -124,6 +144,10 @@ GENERATE_PLAIN_TEXT = True
 # Delete intermediate processed audio files after transcription
 DELETE_INTERMEDIATE_FILES = True
 
+# Write buffer size in bytes for large output files (128 KiB, so writes
+# reach the disk in large blocks rather than the default 8 KiB)
+IO_BUFFER_SIZE = 1 << 17
+
 # ============================================================================
 # TRANSCRIPT FORMATTING
 # ============================================================================
@@ -148,12 +172,25 @@ HEADER_SEPARATOR = "=" * 80
 # Set to None to use all available CPU cores
 NUM_PARALLEL_PROCESSES = None
 
+# Maximum number of audio files converted by a single FFmpeg invocation
+# during preprocessing (saves one process launch per file)
+PREPROCESS_BATCH_SIZE = 32
+
+# When processing several sessions on a GPU, preprocess the next session
+# while the current one is being transcribed (console output of the two
+# interleaves; ignored on CPU, where both stages compete for the same cores)
+OVERLAP_SESSIONS = True
+
 # Skip already transcribed files (for resuming interrupted processing)
 SKIP_EXISTING = True
 
 # Show progress bars
 SHOW_PROGRESS = True
 
+# Profile the merge stage with cProfile, writing profile_<name>.pstats files
+# next to the outputs (inspect with: python -m pstats <file>)
+PROFILE_MERGE = False
+
 # ============================================================================
 # LOGGING SETTINGS
 # ============================================================================
@@ -189,6 +226,20 @@ reproducibility. All processing performed locally with no cloud services.
 # VALIDATION
 # ============================================================================
 
+@lru_cache(maxsize=1)
+def _probe_ffmpeg(executable: str) -> bool:
+    """Check once per process whether the FFmpeg executable can be run."""
+    # PATH lookup is a cheap stat walk; only spawn FFmpeg if it resolves
+    if shutil.which(executable) is None:
+        return False
+    try:
+        subprocess.run([executable, "-version"],
+                      capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+    return True
+
+
 def validate_config():
     """Validate configuration settings and create necessary directories."""
 
@@ -202,12 +253,14 @@ def validate_config():
         raise ValueError(f"Invalid Whisper model: {WHISPER_MODEL}. "
                         f"Valid options: {', '.join(valid_models)}")
 
+    # Validate normalization mode
+    valid_normalize_modes = ["loudnorm", "dynaudnorm"]
+    if NORMALIZE_MODE not in valid_normalize_modes:
+        raise ValueError(f"Invalid normalization mode: {NORMALIZE_MODE}. "
+                        f"Valid options: {', '.join(valid_normalize_modes)}")
+
     # Check if FFmpeg is available
-    import subprocess
-    try:
-        subprocess.run([FFMPEG_EXECUTABLE, "-version"],
-                      capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not _probe_ffmpeg(FFMPEG_EXECUTABLE):
         raise EnvironmentError(f"FFmpeg not found. Please install FFmpeg and "
                              f"ensure it's on your PATH.")
 
@@ -5,78 +5,388 @@ This module combines transcriptions with timestamps and generates
 final output files (TXT and JSON formats).
 """
 
+import io
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
-import math
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Union
+
+import numpy as np
 
 import config
 import utils
-
-
-def analyze_segment_quality(segment: Dict) -> Dict:
+from _profile import profiled
+import _quality_kernel
+
+# Separator lines, built once rather than per write
+_SEC = config.SECTION_SEPARATOR + "\n"
+_HDR = config.HEADER_SEPARATOR + "\n"
+
+# Combined TXT blocks, filled from Annotation fields with str.format_map
+_ANNOTATION_HEADER_TEMPLATE = (
+    _SEC
+    + "ANNOTATION #{id}\n"
+    "VIDEO TIMESTAMP: {timestamp_formatted} ({timestamp_sec} seconds)\n"
+    "AUDIO FILE: {audio_file.name}\n"
+    "DURATION: {duration:.1f} seconds\n"
+)
+_ORPHAN_TEMPLATE = (
+    "File: {audio_file.name}\n"
+    "Created: {creation_time}\n"
+    "Duration: {duration:.1f} seconds\n\n"
+    "{text}\n\n"
+)
+
+# Quality flags as bits of a per-segment mask; FLAG_LUT maps any mask to its
+# recording-level flag names, already in sorted order
+FLAG_NAMES = ('hallucination_detected', 'low_confidence', 'silence_detected')
+FLAG_LUT = [tuple(n for i, n in enumerate(FLAG_NAMES) if mask >> i & 1) for mask in range(8)]
+
+# Per-segment flags list hallucination, silence, low confidence (in that order)
+_SEGMENT_FLAG_LUT = [
+    tuple(FLAG_NAMES[i] for i in (0, 2, 1) if mask >> i & 1) for mask in range(8)
+]
+
+
+def analyze_segments_batch(segments: List[Dict]) -> Dict[str, np.ndarray]:
     """
-    Analyze quality metrics for a single segment.
+    Analyze quality metrics for all segments of a recording in one pass.
+
+    Missing metrics default to a compression ratio of 1.0, a no-speech
+    probability of 0.0 and an average log probability of -0.5. Confidence is
+    exp(avg_logprob), or 0.0 for log probabilities of -10 or below.
 
     Args:
-        segment: Whisper segment dictionary with quality metrics
+        segments: List of Whisper segment dictionaries with quality metrics
 
     Returns:
-        Dictionary with quality analysis results
+        Dictionary of per-segment columns: 'compression_ratio', 'no_speech_prob',
+        'avg_logprob', 'confidence' (float arrays) and 'likely_hallucination',
+        'likely_silence', 'low_confidence' (bool arrays), and 'flag_mask'
+        (uint8 array of FLAG_NAMES bits)
     """
-    compression_ratio = segment.get('compression_ratio', 1.0)
-    no_speech_prob = segment.get('no_speech_prob', 0.0)
-    avg_logprob = segment.get('avg_logprob', -0.5)
-
-    # Detect quality issues
-    likely_hallucination = compression_ratio > config.COMPRESSION_RATIO_THRESHOLD
-    likely_silence = no_speech_prob > config.NO_SPEECH_THRESHOLD
-    low_confidence = avg_logprob < config.CONFIDENCE_THRESHOLD
-
-    # Calculate confidence score (0-1 scale from log probability)
-    # avg_logprob typically ranges from 0 (perfect) to -inf (impossible)
-    # Common range is -0.2 to -1.5
-    confidence = math.exp(avg_logprob) if avg_logprob > -10 else 0.0
+    count = len(segments)
+    compression_ratio = np.fromiter((s.get('compression_ratio', 1.0) for s in segments),
+                                    dtype=np.float64, count=count)
+    no_speech_prob = np.fromiter((s.get('no_speech_prob', 0.0) for s in segments),
+                                 dtype=np.float64, count=count)
+    avg_logprob = np.fromiter((s.get('avg_logprob', -0.5) for s in segments),
+                              dtype=np.float64, count=count)
+
+    # Confidence score (0-1 scale from log probability) and threshold checks
+    kernel = _quality_kernel.get_kernel()
+    confidence, likely_hallucination, likely_silence, low_confidence = kernel(
+        compression_ratio, no_speech_prob, avg_logprob,
+        config.COMPRESSION_RATIO_THRESHOLD, config.NO_SPEECH_THRESHOLD,
+        config.CONFIDENCE_THRESHOLD
+    )
 
     return {
-        'compression_ratio': round(compression_ratio, 2),
-        'no_speech_prob': round(no_speech_prob, 3),
-        'avg_logprob': round(avg_logprob, 3),
-        'confidence': round(confidence, 3),
+        'compression_ratio': compression_ratio,
+        'no_speech_prob': no_speech_prob,
+        'avg_logprob': avg_logprob,
+        'confidence': confidence,
         'likely_hallucination': likely_hallucination,
         'likely_silence': likely_silence,
         'low_confidence': low_confidence,
-        'quality_flags': []
+        'flag_mask': (likely_hallucination.astype(np.uint8)
+                      | low_confidence.astype(np.uint8) << 1
+                      | likely_silence.astype(np.uint8) << 2),
     }
 
 
-def add_quality_flags(quality_analysis: Dict) -> Dict:
+def _segments_with_quality(segments: List[Dict],
+                           analysis: Dict[str, np.ndarray]) -> Tuple[List[Dict], List[str]]:
+    """
+    Build per-segment quality dicts and the recording's overall quality flags.
+
+    Args:
+        segments: List of Whisper segment dictionaries
+        analysis: Quality columns from analyze_segments_batch() for the segments
+
+    Returns:
+        Tuple of (segments_with_quality, sorted quality flags)
+    """
+
+    hallucination = analysis['likely_hallucination'].tolist()
+    silence = analysis['likely_silence'].tolist()
+    low_confidence = analysis['low_confidence'].tolist()
+    flag_mask = analysis['flag_mask']
+
+    # Metric columns are rounded whole-array here rather than per segment
+    segments_with_quality = []
+    for segment, cr, nsp, lp, conf, hall, sil, low, mask in zip(
+            segments,
+            np.round(analysis['compression_ratio'], 2).tolist(),
+            np.round(analysis['no_speech_prob'], 3).tolist(),
+            np.round(analysis['avg_logprob'], 3).tolist(),
+            np.round(analysis['confidence'], 3).tolist(),
+            hallucination, silence, low_confidence,
+            flag_mask.tolist()):
+        segments_with_quality.append({
+            "id": segment.get("id", 0),
+            "start": round(segment.get("start", 0.0), 3),
+            "end": round(segment.get("end", 0.0), 3),
+            "text": segment.get("text", "").strip(),
+            "compression_ratio": cr,
+            "no_speech_prob": nsp,
+            "avg_logprob": lp,
+            "confidence": conf,
+            "likely_hallucination": hall,
+            "likely_silence": sil,
+            "low_confidence": low,
+            "quality_flags": list(_SEGMENT_FLAG_LUT[mask])
+        })
+
+    # Flags of any segment, combined into one mask
+    quality_flags = list(FLAG_LUT[int(np.bitwise_or.reduce(flag_mask))])
+
+    return segments_with_quality, quality_flags
+
+
+@dataclass
+class Annotation:
+    """
+    Everything the output generators need to know about one transcribed recording.
+
+    Built once per session by build_annotations(), so durations, creation times
+    and segment quality are computed a single time and the generators only
+    format them.
+    """
+    id: Union[int, str]
+    audio_file: Path
+    stem: str
+    has_video_timestamp: bool
+    timestamp_sec: Optional[float]
+    timestamp_formatted: Optional[str]
+    creation_time: Optional[str]
+    duration: float
+    language: str
+    text: str
+    word_count: int
+    char_count: int
+    segments_with_quality: List[Dict]
+    quality_flags: List[str]
+    segment_quality: Dict[str, np.ndarray]
+
+
+def _build_annotation(annotation_id: Union[int, str], audio_file: Path, filename_stem: str,
+                      result: Dict, timestamp_sec: Optional[float] = None) -> Annotation:
+    """Build the Annotation for one recording (paired if timestamp_sec is given)."""
+    text = result["text"].strip()
+    segments = result.get("segments", [])
+    has_video_timestamp = timestamp_sec is not None
+
+    # Analyze quality for all segments at once
+    segment_quality = analyze_segments_batch(segments)
+    segments_with_quality, quality_flags = _segments_with_quality(segments, segment_quality)
+
+    return Annotation(
+        id=annotation_id,
+        audio_file=audio_file,
+        stem=filename_stem,
+        has_video_timestamp=has_video_timestamp,
+        timestamp_sec=timestamp_sec,
+        timestamp_formatted=utils.format_timestamp(timestamp_sec) if has_video_timestamp else None,
+        creation_time=None if has_video_timestamp else utils.get_file_creation_time(audio_file),
+        duration=utils.get_audio_duration(audio_file),
+        language=result.get("language", "unknown"),
+        text=text,
+        word_count=utils.count_words(text),
+        char_count=len(text),
+        segments_with_quality=segments_with_quality,
+        quality_flags=quality_flags,
+        segment_quality=segment_quality
+    )
+
+
+def _transcribed_entries(paired_files: List[Dict],
+                         orphaned_files: List[Path],
+                         transcripts: Dict[str, Dict]) -> Tuple[List[Tuple], List[Tuple]]:
     """
-    Add human-readable quality flags to analysis.
+    Match recordings to their transcripts by filename stem, dropping misses.
+
+    Each stem is computed and looked up exactly once.
 
     Args:
-        quality_analysis: Quality analysis dictionary
+        paired_files: List of paired audio/JSON file dicts
+        orphaned_files: List of orphaned audio files
+        transcripts: Dictionary mapping filename stems to Whisper result dicts
 
     Returns:
-        Updated dictionary with quality_flags list
+        Tuple of (paired, orphaned) lists of (position, entry, stem, result)
+        tuples, where position is the 1-based index in the input list
     """
-    flags = []
+    paired = []
+    for i, file_info in enumerate(paired_files, 1):
+        stem = file_info['audio'].stem
+        result = transcripts.get(stem)
+        if result is not None:
+            paired.append((i, file_info, stem, result))
 
-    if quality_analysis['likely_hallucination']:
-        flags.append('hallucination_detected')
-    if quality_analysis['likely_silence']:
-        flags.append('silence_detected')
-    if quality_analysis['low_confidence']:
-        flags.append('low_confidence')
+    orphaned = []
+    for i, audio_file in enumerate(orphaned_files, 1):
+        stem = audio_file.stem
+        result = transcripts.get(stem)
+        if result is not None:
+            orphaned.append((i, audio_file, stem, result))
 
-    quality_analysis['quality_flags'] = flags
-    return quality_analysis
+    return paired, orphaned
 
 
+def build_annotations(paired_files: List[Dict],
+                      orphaned_files: List[Path],
+                      transcripts: Dict[str, Dict]) -> List[Annotation]:
+    """
+    Build the annotations shared by all merged outputs of a session.
+
+    Only recordings with a transcript are included. Paired recordings come
+    first, in timestamp order, with ids numbered by their position in
+    paired_files; orphaned recordings follow with ids "orphan_1", "orphan_2", ...
+
+    Args:
+        paired_files: List of paired audio/JSON file dicts
+        orphaned_files: List of orphaned audio files
+        transcripts: Dictionary mapping filename stems to Whisper result dicts
+
+    Returns:
+        List of Annotation objects
+    """
+    paired_entries, orphaned_entries = _transcribed_entries(paired_files, orphaned_files,
+                                                            transcripts)
+
+    annotations = [
+        _build_annotation(i, file_info['audio'], stem, result, file_info['timestamp_sec'])
+        for i, file_info, stem, result in paired_entries
+    ]
+    annotations.extend(
+        _build_annotation(f"orphan_{n}", audio_file, stem, result)
+        for n, (_, audio_file, stem, result) in enumerate(orphaned_entries, 1)
+    )
+
+    return annotations
+
+
+def _individual_json(annotation: Annotation, enable_quality: bool) -> Dict:
+    """Lay out an annotation as an individual transcript JSON file."""
+    data = {"audio_file": annotation.audio_file.name,
+            "has_video_timestamp": annotation.has_video_timestamp}
+    if annotation.has_video_timestamp:
+        data["video_timestamp_sec"] = annotation.timestamp_sec
+        data["video_timestamp_formatted"] = annotation.timestamp_formatted
+    else:
+        data["file_created"] = annotation.creation_time
+    data.update({
+        "audio_duration_sec": round(annotation.duration, 3),
+        "language": annotation.language,
+        "transcription": annotation.text,
+        "word_count": annotation.word_count,
+        "character_count": annotation.char_count,
+        "quality_flags": annotation.quality_flags,
+        "segments": annotation.segments_with_quality if enable_quality else []
+    })
+    if not annotation.has_video_timestamp:
+        data["note"] = "No matching JSON timestamp file found"
+    return data
+
+
+def _combined_json(annotation: Annotation) -> Dict:
+    """Lay out an annotation as an entry of the combined JSON output."""
+    segments = annotation.segments_with_quality if config.ENABLE_QUALITY_CHECKS else []
+
+    if annotation.has_video_timestamp:
+        return {
+            "id": annotation.id,
+            "has_video_timestamp": True,
+            "video_timestamp_sec": annotation.timestamp_sec,
+            "video_timestamp_formatted": annotation.timestamp_formatted,
+            "audio_file": annotation.audio_file.name,
+            "audio_duration_sec": round(annotation.duration, 3),
+            "language": annotation.language,
+            "transcription": annotation.text,
+            "word_count": annotation.word_count,
+            "character_count": annotation.char_count,
+            "quality_flags": annotation.quality_flags,
+            "segments": segments
+        }
+
+    return {
+        "id": annotation.id,
+        "has_video_timestamp": False,
+        "audio_file": annotation.audio_file.name,
+        "file_created": annotation.creation_time,
+        "audio_duration_sec": round(annotation.duration, 3),
+        "language": annotation.language,
+        "transcription": annotation.text,
+        "word_count": annotation.word_count,
+        "quality_flags": annotation.quality_flags,
+        "segments": segments,
+        "note": "No matching JSON timestamp file found"
+    }
+
+
+def _write_if_changed(output_file: Path, content: str, source_mtime: float) -> None:
+    """
+    Write a text file unless it already holds exactly this content.
+
+    The existing file is only kept if it is newer than the recording it was
+    made from and its content matches, so a changed transcript or changed
+    settings always rewrite it.
+
+    Args:
+        output_file: File to write
+        content: Text the file should contain
+        source_mtime: Modification time of the source recording
+    """
+    try:
+        if (output_file.stat().st_mtime >= source_mtime
+                and output_file.read_text(encoding='utf-8') == content):
+            return
+    except (OSError, UnicodeDecodeError):
+        pass  # Missing or unreadable: write it
+    output_file.write_text(content, encoding='utf-8')
+
+
+def _emit_one_transcript(annotation: Annotation, transcripts_dir: Path,
+                         enable_quality: bool) -> None:
+    """Write the TXT and JSON transcript files for one recording."""
+    filename_stem = annotation.stem
+    quality_flags = annotation.quality_flags
+
+    # Timestamp (or orphan) header, plus quality warnings if any
+    if annotation.has_video_timestamp:
+        header = f"[VIDEO TIMESTAMP: {annotation.timestamp_formatted}]\n"
+    else:
+        header = f"[ORPHANED - NO VIDEO TIMESTAMP]\n[File created: {annotation.creation_time}]\n"
+    if enable_quality and quality_flags:
+        header += f"[QUALITY WARNINGS: {', '.join(quality_flags)}]\n"
+
+    body = annotation.text + "\n"
+    if not annotation.has_video_timestamp:
+        body = "This recording has no matching JSON timestamp file.\n\n" + body
+
+    txt_file = transcripts_dir / f"{filename_stem}.txt"
+    json_file = transcripts_dir / f"{filename_stem}.json"
+    json_data = _individual_json(annotation, enable_quality)
+
+    if not config.SKIP_EXISTING:
+        txt_file.write_text(header + "\n" + body, encoding='utf-8')
+        # JSON file with metadata and quality metrics
+        utils.save_json_data(json_data, json_file)
+        return
+
+    # When resuming, leave files alone that already hold exactly this content
+    source_mtime = annotation.audio_file.stat().st_mtime
+    _write_if_changed(txt_file, header + "\n" + body, source_mtime)
+    _write_if_changed(json_file, utils.dumps_json(json_data), source_mtime)
+
+
+@profiled("individual_transcripts")
 def generate_individual_transcripts(paired_files: List[Dict],
                                     orphaned_files: List[Path],
                                     transcripts: Dict[str, Dict],
-                                    output_dir: Path) -> None:
+                                    output_dir: Path,
+                                    annotations: Optional[List[Annotation]] = None) -> None:
     """
     Generate individual transcript files (TXT and JSON) with timestamp headers.
 
@@ -85,153 +395,30 @@ def generate_individual_transcripts(paired_files: List[Dict],
         orphaned_files: List of orphaned audio files
         transcripts: Dictionary mapping filename stems to Whisper result dicts
         output_dir: Output directory for transcript files
+        annotations: Precomputed result of build_annotations (optional)
     """
     transcripts_dir = output_dir / "transcripts"
     utils.ensure_dir(transcripts_dir)
 
-    # Process paired files
-    for file_info in paired_files:
-        audio_file = file_info['audio']
-        timestamp_sec = file_info['timestamp_sec']
-        filename_stem = audio_file.stem
-
-        # Match by filename stem
-        if filename_stem not in transcripts:
-            continue
-
-        result = transcripts[filename_stem]
-        text = result["text"].strip()
-        segments = result.get("segments", [])
-        language = result.get("language", "unknown")
-        duration = utils.get_audio_duration(audio_file)
-
-        # Analyze quality for each segment
-        segments_with_quality = []
-        quality_flags = set()
-
-        for segment in segments:
-            quality = analyze_segment_quality(segment)
-            quality = add_quality_flags(quality)
-
-            # Collect overall quality flags
-            quality_flags.update(quality['quality_flags'])
-
-            segments_with_quality.append({
-                "id": segment.get("id", 0),
-                "start": round(segment.get("start", 0.0), 3),
-                "end": round(segment.get("end", 0.0), 3),
-                "text": segment.get("text", "").strip(),
-                **quality
-            })
-
-        # Create TXT file with timestamp and quality warnings
-        txt_file = transcripts_dir / f"{filename_stem}.txt"
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            # Write timestamp header
-            f.write(f"[VIDEO TIMESTAMP: {utils.format_timestamp(timestamp_sec)}]\n")
-
-            # Write quality warnings if any
-            if config.ENABLE_QUALITY_CHECKS and quality_flags:
-                f.write(f"[QUALITY WARNINGS: {', '.join(sorted(quality_flags))}]\n")
-
-            f.write("\n")
-
-            # Write transcription
-            f.write(text)
-            f.write("\n")
-
-        # Create JSON file with metadata and quality metrics
-        json_file = transcripts_dir / f"{filename_stem}.json"
-        json_data = {
-            "audio_file": audio_file.name,
-            "has_video_timestamp": True,
-            "video_timestamp_sec": timestamp_sec,
-            "video_timestamp_formatted": utils.format_timestamp(timestamp_sec),
-            "audio_duration_sec": round(duration, 3),
-            "language": language,
-            "transcription": text,
-            "word_count": utils.count_words(text),
-            "character_count": len(text),
-            "quality_flags": sorted(list(quality_flags)),
-            "segments": segments_with_quality if config.ENABLE_QUALITY_CHECKS else []
-        }
-        utils.save_json_data(json_data, json_file)
+    if annotations is None:
+        annotations = build_annotations(paired_files, orphaned_files, transcripts)
 
-    # Process orphaned files
-    for audio_file in orphaned_files:
-        filename_stem = audio_file.stem
-
-        # Match by filename stem
-        if filename_stem not in transcripts:
-            continue
-
-        result = transcripts[filename_stem]
-        text = result["text"].strip()
-        segments = result.get("segments", [])
-        language = result.get("language", "unknown")
-        duration = utils.get_audio_duration(audio_file)
-        creation_time = utils.get_file_creation_time(audio_file)
-
-        # Analyze quality for each segment
-        segments_with_quality = []
-        quality_flags = set()
-
-        for segment in segments:
-            quality = analyze_segment_quality(segment)
-            quality = add_quality_flags(quality)
-
-            # Collect overall quality flags
-            quality_flags.update(quality['quality_flags'])
-
-            segments_with_quality.append({
-                "id": segment.get("id", 0),
-                "start": round(segment.get("start", 0.0), 3),
-                "end": round(segment.get("end", 0.0), 3),
-                "text": segment.get("text", "").strip(),
-                **quality
-            })
-
-        # Create TXT file
-        txt_file = transcripts_dir / f"{filename_stem}.txt"
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            # Write orphan header
-            f.write(f"[ORPHANED - NO VIDEO TIMESTAMP]\n")
-            f.write(f"[File created: {creation_time}]\n")
-
-            # Write quality warnings if any
-            if config.ENABLE_QUALITY_CHECKS and quality_flags:
-                f.write(f"[QUALITY WARNINGS: {', '.join(sorted(quality_flags))}]\n")
-
-            f.write("\n")
-            f.write("This recording has no matching JSON timestamp file.\n\n")
-            # Write transcription
-            f.write(text)
-            f.write("\n")
-
-        # Create JSON file with metadata
-        json_file = transcripts_dir / f"{filename_stem}.json"
-        json_data = {
-            "audio_file": audio_file.name,
-            "has_video_timestamp": False,
-            "file_created": creation_time,
-            "audio_duration_sec": round(duration, 3),
-            "language": language,
-            "transcription": text,
-            "word_count": utils.count_words(text),
-            "character_count": len(text),
-            "quality_flags": sorted(list(quality_flags)),
-            "segments": segments_with_quality if config.ENABLE_QUALITY_CHECKS else [],
-            "note": "No matching JSON timestamp file found"
-        }
-        utils.save_json_data(json_data, json_file)
+    # Each file is small, so writing them in the calling process is faster
+    # than paying for worker start-up
+    enable_quality = config.ENABLE_QUALITY_CHECKS
+    for annotation in annotations:
+        _emit_one_transcript(annotation, transcripts_dir, enable_quality)
 
 
+@profiled("combined_txt")
 def generate_combined_txt(paired_files: List[Dict],
                          orphaned_files: List[Path],
                          transcripts: Dict[str, Dict],
                          session_name: str,
                          video_file: Path,
-                         output_file: Path) -> None:
+                         output_file: Path,
+                         annotations: Optional[List[Annotation]] = None,
+                         processing_timestamp: Optional[datetime] = None) -> None:
     """
     Generate combined transcript in TXT format.
 
@@ -242,97 +429,80 @@ def generate_combined_txt(paired_files: List[Dict],
         session_name: Name of the session
         video_file: Path to video file (if exists)
         output_file: Output TXT file path
+        annotations: Precomputed result of build_annotations (optional)
+        processing_timestamp: Session timestamp shared by all outputs (default: now)
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
-        # Header
-        f.write(config.HEADER_SEPARATOR + "\n")
-        f.write("MICRO-PHENOMENOLOGICAL INTERVIEW TRANSCRIPT\n")
-        f.write(config.HEADER_SEPARATOR + "\n")
-        f.write(f"Session: {session_name}\n")
-        if video_file:
-            f.write(f"Video File: {video_file.name}\n")
-        f.write(f"Total Recordings: {len(paired_files) + len(orphaned_files)}\n")
-        f.write(f"Transcription Model: Whisper {config.WHISPER_MODEL}\n")
-        f.write(f"Processing Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(config.HEADER_SEPARATOR + "\n\n\n")
-
-        # Paired recordings
-        for i, file_info in enumerate(paired_files, 1):
-            audio_file = file_info['audio']
-            timestamp_sec = file_info['timestamp_sec']
-            filename_stem = audio_file.stem
-
-            # Match by filename stem
-            if filename_stem not in transcripts:
-                continue
-
-            result = transcripts[filename_stem]
-            text = result["text"].strip()
-            segments = result.get("segments", [])
-            duration = utils.get_audio_duration(audio_file)
-
-            # Analyze quality
-            quality_flags = set()
-            for segment in segments:
-                quality = analyze_segment_quality(segment)
-                quality = add_quality_flags(quality)
-                quality_flags.update(quality['quality_flags'])
-
-            f.write(config.SECTION_SEPARATOR + "\n")
-            f.write(f"ANNOTATION #{i}\n")
-            f.write(f"VIDEO TIMESTAMP: {utils.format_timestamp(timestamp_sec)} ({timestamp_sec} seconds)\n")
-            f.write(f"AUDIO FILE: {audio_file.name}\n")
-            f.write(f"DURATION: {duration:.1f} seconds\n")
-
-            # Add quality warnings if any
-            if config.ENABLE_QUALITY_CHECKS and quality_flags:
-                f.write(f"QUALITY WARNINGS: {', '.join(sorted(quality_flags))}\n")
-
-            f.write(config.SECTION_SEPARATOR + "\n\n")
-            f.write(text)
-            f.write("\n\n\n")
-
-        # Orphaned recordings (if any)
-        if orphaned_files and any(f.stem in transcripts for f in orphaned_files):
-            f.write(config.SECTION_SEPARATOR + "\n")
-            f.write("ORPHANED RECORDINGS (No Video Timestamp)\n")
-            f.write(config.SECTION_SEPARATOR + "\n\n")
-
-            for audio_file in orphaned_files:
-                filename_stem = audio_file.stem
-
-                # Match by filename stem
-                if filename_stem not in transcripts:
-                    continue
-
-                result = transcripts[filename_stem]
-                text = result["text"].strip()
-                creation_time = utils.get_file_creation_time(audio_file)
-                duration = utils.get_audio_duration(audio_file)
-
-                f.write(f"File: {audio_file.name}\n")
-                f.write(f"Created: {creation_time}\n")
-                f.write(f"Duration: {duration:.1f} seconds\n\n")
-                f.write(text)
-                f.write("\n\n")
-
-        # Footer
-        total_duration = sum(utils.get_audio_duration(f['audio']) for f in paired_files if f['audio'].stem in transcripts)
-        total_words = sum(utils.count_words(transcripts[f['audio'].stem]["text"]) for f in paired_files if f['audio'].stem in transcripts)
-
-        f.write(config.HEADER_SEPARATOR + "\n")
-        f.write("END OF TRANSCRIPT\n")
-        f.write(f"Total Audio Duration: {total_duration:.1f} seconds\n")
-        f.write(f"Total Word Count: {total_words} words\n")
-        f.write(config.HEADER_SEPARATOR + "\n")
-
-
+    if processing_timestamp is None:
+        processing_timestamp = datetime.now()
+
+    if annotations is None:
+        annotations = build_annotations(paired_files, orphaned_files, transcripts)
+    paired = [a for a in annotations if a.has_video_timestamp]
+    orphaned = [a for a in annotations if not a.has_video_timestamp]
+
+    quality_checks = config.ENABLE_QUALITY_CHECKS
+    buf = io.StringIO()
+    w = buf.write
+
+    # Header
+    w(_HDR)
+    w("MICRO-PHENOMENOLOGICAL INTERVIEW TRANSCRIPT\n")
+    w(_HDR)
+    w(f"Session: {session_name}\n")
+    if video_file:
+        w(f"Video File: {video_file.name}\n")
+    w(f"Total Recordings: {len(paired_files) + len(orphaned_files)}\n")
+    w(f"Transcription Model: Whisper {config.WHISPER_MODEL}\n")
+    w(f"Processing Date: {processing_timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w(_HDR + "\n\n")
+
+    # Paired recordings
+    for annotation in paired:
+        quality_flags = annotation.quality_flags
+
+        w(_ANNOTATION_HEADER_TEMPLATE.format_map(vars(annotation)))
+
+        # Add quality warnings if any
+        if quality_checks and quality_flags:
+            w(f"QUALITY WARNINGS: {', '.join(quality_flags)}\n")
+
+        w(f"{_SEC}\n{annotation.text}\n\n\n")
+
+    # Orphaned recordings (if any)
+    if orphaned:
+        w(_SEC)
+        w("ORPHANED RECORDINGS (No Video Timestamp)\n")
+        w(_SEC + "\n")
+
+        for orphan in orphaned:
+            w(_ORPHAN_TEMPLATE.format_map(vars(orphan)))
+
+    # Footer
+    total_duration = total_words = 0
+    for annotation in paired:
+        total_duration += annotation.duration
+        total_words += annotation.word_count
+
+    w(_HDR)
+    w("END OF TRANSCRIPT\n")
+    w(f"Total Audio Duration: {total_duration:.1f} seconds\n")
+    w(f"Total Word Count: {total_words} words\n")
+    w(_HDR)
+
+    # Single write for the whole document, through a large buffer
+    with open(output_file, 'w', encoding='utf-8', buffering=config.IO_BUFFER_SIZE) as f:
+        f.write(buf.getvalue())
+
+
+@profiled("combined_json")
 def generate_combined_json(paired_files: List[Dict],
                           orphaned_files: List[Path],
                           transcripts: Dict[str, Dict],
                           session_name: str,
                           video_file: Path,
-                          output_file: Path) -> None:
+                          output_file: Path,
+                          annotations: Optional[List[Annotation]] = None,
+                          processing_timestamp: Optional[datetime] = None) -> None:
     """
     Generate combined transcript in JSON format.
 
@@ -343,182 +513,104 @@ def generate_combined_json(paired_files: List[Dict],
         session_name: Name of the session
         video_file: Path to video file (if exists)
         output_file: Output JSON file path
+        annotations: Precomputed result of build_annotations (optional)
+        processing_timestamp: Session timestamp shared by all outputs (default: now)
     """
-    # Build annotations list
-    annotations = []
-    total_quality_issues = {"hallucination": 0, "silence": 0, "low_confidence": 0}
+    if processing_timestamp is None:
+        processing_timestamp = datetime.now()
 
-    for i, file_info in enumerate(paired_files, 1):
-        audio_file = file_info['audio']
-        timestamp_sec = file_info['timestamp_sec']
-        filename_stem = audio_file.stem
-
-        # Match by filename stem
-        if filename_stem not in transcripts:
-            continue
-
-        result = transcripts[filename_stem]
-        text = result["text"].strip()
-        segments = result.get("segments", [])
-        language = result.get("language", "unknown")
-        duration = utils.get_audio_duration(audio_file)
-
-        # Analyze quality for each segment
-        segments_with_quality = []
-        quality_flags = set()
-
-        for segment in segments:
-            quality = analyze_segment_quality(segment)
-            quality = add_quality_flags(quality)
-
-            # Collect overall quality flags
-            quality_flags.update(quality['quality_flags'])
-
-            # Count quality issues
-            if quality['likely_hallucination']:
-                total_quality_issues["hallucination"] += 1
-            if quality['likely_silence']:
-                total_quality_issues["silence"] += 1
-            if quality['low_confidence']:
-                total_quality_issues["low_confidence"] += 1
-
-            segments_with_quality.append({
-                "id": segment.get("id", 0),
-                "start": round(segment.get("start", 0.0), 3),
-                "end": round(segment.get("end", 0.0), 3),
-                "text": segment.get("text", "").strip(),
-                **quality
-            })
-
-        annotations.append({
-            "id": i,
-            "has_video_timestamp": True,
-            "video_timestamp_sec": timestamp_sec,
-            "video_timestamp_formatted": utils.format_timestamp(timestamp_sec),
-            "audio_file": audio_file.name,
-            "audio_duration_sec": round(duration, 3),
-            "language": language,
-            "transcription": text,
-            "word_count": utils.count_words(text),
-            "character_count": len(text),
-            "quality_flags": sorted(list(quality_flags)),
-            "segments": segments_with_quality if config.ENABLE_QUALITY_CHECKS else []
-        })
+    if annotations is None:
+        annotations = build_annotations(paired_files, orphaned_files, transcripts)
+    paired = [a for a in annotations if a.has_video_timestamp]
+    orphaned = [a for a in annotations if not a.has_video_timestamp]
+    quality_checks = config.ENABLE_QUALITY_CHECKS
 
-    # Build orphaned recordings list
-    orphaned_recordings = []
-    for audio_file in orphaned_files:
-        filename_stem = audio_file.stem
-
-        # Match by filename stem
-        if filename_stem not in transcripts:
-            continue
-
-        result = transcripts[filename_stem]
-        text = result["text"].strip()
-        segments = result.get("segments", [])
-        language = result.get("language", "unknown")
-        duration = utils.get_audio_duration(audio_file)
-        creation_time = utils.get_file_creation_time(audio_file)
-
-        # Analyze quality for each segment
-        segments_with_quality = []
-        quality_flags = set()
-
-        for segment in segments:
-            quality = analyze_segment_quality(segment)
-            quality = add_quality_flags(quality)
-
-            quality_flags.update(quality['quality_flags'])
-
-            # Count quality issues
-            if quality['likely_hallucination']:
-                total_quality_issues["hallucination"] += 1
-            if quality['likely_silence']:
-                total_quality_issues["silence"] += 1
-            if quality['low_confidence']:
-                total_quality_issues["low_confidence"] += 1
-
-            segments_with_quality.append({
-                "id": segment.get("id", 0),
-                "start": round(segment.get("start", 0.0), 3),
-                "end": round(segment.get("end", 0.0), 3),
-                "text": segment.get("text", "").strip(),
-                **quality
-            })
-
-        orphaned_recordings.append({
-            "id": f"orphan_{len(orphaned_recordings) + 1}",
-            "has_video_timestamp": False,
-            "audio_file": audio_file.name,
-            "file_created": creation_time,
-            "audio_duration_sec": round(duration, 3),
-            "language": language,
-            "transcription": text,
-            "word_count": utils.count_words(text),
-            "quality_flags": sorted(list(quality_flags)),
-            "segments": segments_with_quality if config.ENABLE_QUALITY_CHECKS else [],
-            "note": "No matching JSON timestamp file found"
-        })
+    # Count quality issues across all segments
+    total_quality_issues = {"hallucination": 0, "silence": 0, "low_confidence": 0}
+    if quality_checks:
+        for annotation in annotations:
+            for segment in annotation.segments_with_quality:
+                if segment['likely_hallucination']:
+                    total_quality_issues["hallucination"] += 1
+                if segment['likely_silence']:
+                    total_quality_issues["silence"] += 1
+                if segment['low_confidence']:
+                    total_quality_issues["low_confidence"] += 1
+
+    # Calculate statistics and count recordings with quality issues in one pass
+    total_duration = total_words = total_chars = total_segments = 0
+    recordings_with_hallucination = 0
+    recordings_with_silence = 0
+    recordings_with_low_confidence = 0
+
+    for a in paired:
+        total_duration += round(a.duration, 3)
+        total_words += a.word_count
+        total_chars += a.char_count
+        total_segments += len(a.segments_with_quality)
+
+        quality_flags = a.quality_flags
+        if 'hallucination_detected' in quality_flags:
+            recordings_with_hallucination += 1
+        if 'silence_detected' in quality_flags:
+            recordings_with_silence += 1
+        if 'low_confidence' in quality_flags:
+            recordings_with_low_confidence += 1
+
+    session_metadata = {
+        "session_id": session_name,
+        "video_file": video_file.name if video_file else None,
+        "video_file_exists": video_file.exists() if video_file else False,
+        "processing_timestamp": processing_timestamp.isoformat(),
+        "transcription_model": f"whisper-{config.WHISPER_MODEL}",
+        "total_recordings": len(paired_files) + len(orphaned_files),
+        "total_with_timestamps": len(paired),
+        "total_orphaned": len(orphaned),
+        "pipeline_version": config.PIPELINE_VERSION,
+        "quality_checks_enabled": quality_checks
+    }
 
-    # Calculate statistics
-    total_duration = sum(a['audio_duration_sec'] for a in annotations)
-    total_words = sum(a['word_count'] for a in annotations)
-    total_chars = sum(a['character_count'] for a in annotations)
-
-    # Count recordings with quality issues
-    recordings_with_hallucination = sum(1 for a in annotations if 'hallucination_detected' in a.get('quality_flags', []))
-    recordings_with_silence = sum(1 for a in annotations if 'silence_detected' in a.get('quality_flags', []))
-    recordings_with_low_confidence = sum(1 for a in annotations if 'low_confidence' in a.get('quality_flags', []))
-
-    # Build complete JSON structure
-    data = {
-        "session_metadata": {
-            "session_id": session_name,
-            "video_file": video_file.name if video_file else None,
-            "video_file_exists": video_file.exists() if video_file else False,
-            "processing_timestamp": datetime.now().isoformat(),
-            "transcription_model": f"whisper-{config.WHISPER_MODEL}",
-            "total_recordings": len(paired_files) + len(orphaned_files),
-            "total_with_timestamps": len(annotations),
-            "total_orphaned": len(orphaned_recordings),
-            "pipeline_version": config.PIPELINE_VERSION,
-            "quality_checks_enabled": config.ENABLE_QUALITY_CHECKS
+    statistics = {
+        "total_audio_duration_sec": round(total_duration, 1),
+        "total_audio_duration_formatted": utils.format_timestamp(total_duration, include_milliseconds=False),
+        "total_words": total_words,
+        "total_characters": total_chars,
+        "average_annotation_duration_sec": round(total_duration / len(paired), 1) if paired else 0,
+        "average_words_per_annotation": round(total_words / len(paired)) if paired else 0,
+        "video_coverage": {
+            "first_timestamp_sec": paired[0].timestamp_sec if paired else None,
+            "last_timestamp_sec": paired[-1].timestamp_sec if paired else None,
+            "span_sec": round(paired[-1].timestamp_sec - paired[0].timestamp_sec, 3) if len(paired) > 1 else 0,
+            "span_formatted": utils.format_timestamp(paired[-1].timestamp_sec - paired[0].timestamp_sec, include_milliseconds=False) if len(paired) > 1 else "00:00:00"
         },
-        "annotations": annotations,
-        "orphaned_recordings": orphaned_recordings,
-        "statistics": {
-            "total_audio_duration_sec": round(total_duration, 1),
-            "total_audio_duration_formatted": utils.format_timestamp(total_duration, include_milliseconds=False),
-            "total_words": total_words,
-            "total_characters": total_chars,
-            "average_annotation_duration_sec": round(total_duration / len(annotations), 1) if annotations else 0,
-            "average_words_per_annotation": round(total_words / len(annotations)) if annotations else 0,
-            "video_coverage": {
-                "first_timestamp_sec": annotations[0]['video_timestamp_sec'] if annotations else None,
-                "last_timestamp_sec": annotations[-1]['video_timestamp_sec'] if annotations else None,
-                "span_sec": round(annotations[-1]['video_timestamp_sec'] - annotations[0]['video_timestamp_sec'], 3) if len(annotations) > 1 else 0,
-                "span_formatted": utils.format_timestamp(annotations[-1]['video_timestamp_sec'] - annotations[0]['video_timestamp_sec'], include_milliseconds=False) if len(annotations) > 1 else "00:00:00"
-            },
-            "quality_metrics": {
-                "total_segments": sum(len(a.get('segments', [])) for a in annotations),
-                "segments_with_hallucination": total_quality_issues["hallucination"],
-                "segments_with_silence": total_quality_issues["silence"],
-                "segments_with_low_confidence": total_quality_issues["low_confidence"],
-                "recordings_with_hallucination": recordings_with_hallucination,
-                "recordings_with_silence": recordings_with_silence,
-                "recordings_with_low_confidence": recordings_with_low_confidence,
-                "thresholds": {
-                    "compression_ratio_threshold": config.COMPRESSION_RATIO_THRESHOLD,
-                    "no_speech_threshold": config.NO_SPEECH_THRESHOLD,
-                    "confidence_threshold": config.CONFIDENCE_THRESHOLD
-                }
-            } if config.ENABLE_QUALITY_CHECKS else {}
-        }
+        "quality_metrics": {
+            "total_segments": total_segments,
+            "segments_with_hallucination": total_quality_issues["hallucination"],
+            "segments_with_silence": total_quality_issues["silence"],
+            "segments_with_low_confidence": total_quality_issues["low_confidence"],
+            "recordings_with_hallucination": recordings_with_hallucination,
+            "recordings_with_silence": recordings_with_silence,
+            "recordings_with_low_confidence": recordings_with_low_confidence,
+            "thresholds": {
+                "compression_ratio_threshold": config.COMPRESSION_RATIO_THRESHOLD,
+                "no_speech_threshold": config.NO_SPEECH_THRESHOLD,
+                "confidence_threshold": config.CONFIDENCE_THRESHOLD
+            }
+        } if quality_checks else {}
     }
 
-    # Save JSON
-    utils.save_json_data(data, output_file)
+    # Stream the document, laying out and writing one annotation at a time
+    try:
+        with utils.StreamingJsonWriter(output_file) as writer:
+            writer.write_field("session_metadata", session_metadata)
+            for key, group in (("annotations", paired), ("orphaned_recordings", orphaned)):
+                writer.begin_list(key)
+                for annotation in group:
+                    writer.write_item(_combined_json(annotation))
+                writer.end_list()
+            writer.write_field("statistics", statistics)
+    except Exception as e:
+        print(f"Error saving {output_file}: {e}")
 
 
 def generate_plain_text(paired_files: List[Dict],
@@ -534,43 +626,29 @@ def generate_plain_text(paired_files: List[Dict],
         transcripts: Dictionary mapping filename stems to Whisper result dicts
         output_file: Output TXT file path
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
-        # Process paired files (ordered by timestamp)
-        for i, file_info in enumerate(paired_files):
-            audio_file = file_info['audio']
-            filename_stem = audio_file.stem
-
-            # Match by filename stem
-            if filename_stem not in transcripts:
-                continue
-
-            result = transcripts[filename_stem]
-            text = result["text"].strip()
-
-            # Write transcription text
-            f.write(text)
-            
-            # Add double newline separator between recordings
-            if i < len(paired_files) - 1 or orphaned_files:
-                f.write("\n\n")
-
-        # Process orphaned files
-        for i, audio_file in enumerate(orphaned_files):
-            filename_stem = audio_file.stem
-
-            # Match by filename stem
-            if filename_stem not in transcripts:
-                continue
-
-            result = transcripts[filename_stem]
-            text = result["text"].strip()
-
-            # Write transcription text
-            f.write(text)
-            
-            # Add double newline separator between recordings (except last)
-            if i < len(orphaned_files) - 1:
-                f.write("\n\n")
+    paired_entries, orphaned_entries = _transcribed_entries(paired_files, orphaned_files,
+                                                            transcripts)
+    parts = []
+
+    # Process paired files (ordered by timestamp)
+    for i, _, _, result in paired_entries:
+        # Transcription text
+        parts.append(result["text"].strip())
+
+        # Add double newline separator between recordings
+        if i < len(paired_files) or orphaned_files:
+            parts.append("\n\n")
+
+    # Process orphaned files
+    for i, _, _, result in orphaned_entries:
+        # Transcription text
+        parts.append(result["text"].strip())
+
+        # Add double newline separator between recordings (except last)
+        if i < len(orphaned_files):
+            parts.append("\n\n")
+
+    Path(output_file).write_text("".join(parts), encoding='utf-8')
 
 
 if __name__ == "__main__":
@@ -5,14 +5,94 @@ This module handles audio normalization and format conversion using FFmpeg.
 Converts audio to optimal format for Whisper transcription (16kHz mono 16-bit PCM).
 """
 
+import hashlib
+import math
 import subprocess
+import wave
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 import multiprocessing as mp
+from multiprocessing.pool import ThreadPool
 
 import config
 import utils
 
+# FFmpeg audio filter for each config.NORMALIZE_MODE
+_NORMALIZE_FILTERS = {
+    "loudnorm": "loudnorm",
+    "dynaudnorm": "dynaudnorm=p=0.95:m=10",
+}
+
+# Keep FFmpeg's stderr down to actual errors (no banner or progress stats)
+_QUIET_FLAGS = ['-hide_banner', '-nostats', '-loglevel', 'error']
+
+# Bytes hashed from each end of an input file for its fingerprint
+_FINGERPRINT_CHUNK = 64 * 1024
+
+
+def _input_fingerprint(input_file: Path) -> Dict:
+    """
+    Identify an input file and the settings it would be processed with.
+
+    Uses size, mtime and a BLAKE2 hash of the first and last 64 KiB, so
+    unchanged files are recognized without reading them in full.
+
+    Args:
+        input_file: Path to input audio file
+
+    Returns:
+        JSON-serializable fingerprint dict
+    """
+    stat = input_file.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    with open(input_file, 'rb') as f:
+        digest.update(f.read(_FINGERPRINT_CHUNK))
+        if stat.st_size > _FINGERPRINT_CHUNK:
+            f.seek(max(_FINGERPRINT_CHUNK, stat.st_size - _FINGERPRINT_CHUNK))
+            digest.update(f.read())
+
+    return {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "hash": digest.hexdigest(),
+        "settings": [config.TARGET_SAMPLE_RATE, config.TARGET_CHANNELS,
+                     config.NORMALIZE_MODE if config.NORMALIZE_AUDIO else None]
+    }
+
+
+def _fingerprint_file(output_file: Path) -> Path:
+    """Sidecar next to a processed file recording the input it was made from."""
+    return output_file.with_suffix('.meta.json')
+
+
+def _output_up_to_date(input_file: Path, output_file: Path) -> bool:
+    """
+    Check whether output_file was already produced from the current input_file.
+
+    Args:
+        input_file: Path to input audio file
+        output_file: Path to output processed file
+
+    Returns:
+        True if preprocessing can be skipped
+    """
+    if not config.SKIP_EXISTING:
+        return False
+    try:
+        if output_file.stat().st_mtime <= input_file.stat().st_mtime:
+            return False
+        meta_file = _fingerprint_file(output_file)
+        if not meta_file.exists():
+            return False
+        return utils.load_json_data(meta_file) == _input_fingerprint(input_file)
+    except OSError:
+        return False
+
+
+def _record_fingerprint(input_file: Path, output_file: Path) -> None:
+    """Write the fingerprint sidecar for a freshly processed file."""
+    utils.save_json_data(_input_fingerprint(input_file), _fingerprint_file(output_file))
+
 
 def preprocess_single_audio(input_file: Path, output_file: Path) -> bool:
     """
@@ -25,6 +105,10 @@ def preprocess_single_audio(input_file: Path, output_file: Path) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    # Skip files already processed from identical input
+    if _output_up_to_date(input_file, output_file):
+        return True
+
     try:
         # Ensure output directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -32,6 +116,7 @@ def preprocess_single_audio(input_file: Path, output_file: Path) -> bool:
         # Build FFmpeg command
         cmd = [
             config.FFMPEG_EXECUTABLE,
+            *_QUIET_FLAGS,
             '-i', str(input_file),
             '-vn',  # No video
             '-ar', str(config.TARGET_SAMPLE_RATE),  # Sample rate
@@ -41,29 +126,123 @@ def preprocess_single_audio(input_file: Path, output_file: Path) -> bool:
 
         # Add loudness normalization if enabled
         if config.NORMALIZE_AUDIO:
-            cmd.extend(['-af', 'loudnorm'])
+            cmd.extend(['-af', _NORMALIZE_FILTERS[config.NORMALIZE_MODE]])
 
         # Output file (overwrite if exists)
         cmd.extend(['-y', str(output_file)])
 
-        # Run FFmpeg
-        result = subprocess.run(
+        # Run FFmpeg; stderr (errors only) is decoded only if it fails
+        subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=True
         )
 
+        _record_fingerprint(input_file, output_file)
         return True
 
     except subprocess.CalledProcessError as e:
-        print(f"Error preprocessing {input_file.name}: {e.stderr}")
+        print(f"Error preprocessing {input_file.name}: "
+              f"{e.stderr.decode('utf-8', errors='replace')}")
         return False
     except Exception as e:
         print(f"Unexpected error preprocessing {input_file.name}: {e}")
         return False
 
 
+def _build_batch_command(pairs: List[Tuple[Path, Path]]) -> List[str]:
+    """
+    Build one FFmpeg command converting every input of a batch to its own output.
+
+    Args:
+        pairs: List of (input_file, output_file) tuples
+
+    Returns:
+        FFmpeg command line as a list of arguments
+    """
+    cmd = [config.FFMPEG_EXECUTABLE, *_QUIET_FLAGS]
+    for input_file, _ in pairs:
+        cmd.extend(['-i', str(input_file)])
+
+    # Loudness normalization runs per stream, so each output gets its own chain
+    if config.NORMALIZE_AUDIO:
+        normalize_filter = _NORMALIZE_FILTERS[config.NORMALIZE_MODE]
+        cmd.extend(['-filter_complex', ';'.join(
+            f'[{k}:a]{normalize_filter}[a{k}]' for k in range(len(pairs))
+        )])
+
+    for k, (_, output_file) in enumerate(pairs):
+        cmd.extend([
+            '-map', f'[a{k}]' if config.NORMALIZE_AUDIO else f'{k}:a',
+            '-ar', str(config.TARGET_SAMPLE_RATE),  # Sample rate
+            '-ac', str(config.TARGET_CHANNELS),  # Channels (mono)
+            '-sample_fmt', 's16',  # 16-bit PCM
+            '-y', str(output_file)
+        ])
+
+    return cmd
+
+
+def preprocess_audio_batch(pairs: List[Tuple[Path, Path]]) -> List[bool]:
+    """
+    Preprocess a batch of audio files with a single FFmpeg process.
+
+    If the batch command fails, the files are retried one by one so that the
+    failure is attributed to the file that caused it.
+
+    Args:
+        pairs: List of (input_file, output_file) tuples
+
+    Returns:
+        List of success flags, one per pair
+    """
+    # Only files not already processed from identical input go to FFmpeg
+    stale = [pair for pair in pairs if not _output_up_to_date(*pair)]
+    if len(stale) <= 1:
+        return [preprocess_single_audio(*pair) for pair in pairs]
+
+    try:
+        for _, output_file in stale:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        subprocess.run(
+            _build_batch_command(stale),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True
+        )
+        for pair in stale:
+            _record_fingerprint(*pair)
+        return [True] * len(pairs)
+
+    except (subprocess.CalledProcessError, OSError):
+        return [preprocess_single_audio(inp, out) for inp, out in pairs]
+
+
+def measure_durations(processed_files: List[Path]) -> Dict[str, float]:
+    """
+    Read durations from the headers of preprocessed WAV files.
+
+    The files are 16-bit PCM written by FFmpeg, so the standard library
+    wave module can read them without spawning ffprobe.
+
+    Args:
+        processed_files: List of preprocessed audio file paths
+
+    Returns:
+        Dictionary mapping filename stems to durations in seconds
+    """
+    durations = {}
+    for processed_file in processed_files:
+        try:
+            with wave.open(str(processed_file), 'rb') as wav:
+                durations[processed_file.stem] = wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError, OSError) as e:
+            print(f"Warning: Could not read duration of {processed_file.name}: {e}")
+    return durations
+
+
 def preprocess_audio_files(audio_files: List[Path], output_dir: Path,
                            parallel: bool = True) -> List[Path]:
     """
@@ -85,20 +264,30 @@ def preprocess_audio_files(audio_files: List[Path], output_dir: Path,
         output_file = output_dir / audio_file.name
         pairs.append((audio_file, output_file))
 
-    # Process files
+    # Process files in batches, one FFmpeg process per batch
     if parallel and config.NUM_PARALLEL_PROCESSES != 1:
         # Parallel processing
         num_processes = config.NUM_PARALLEL_PROCESSES or mp.cpu_count()
         num_processes = min(num_processes, len(pairs))
 
+        # Keep at least one batch per process so every process has work
+        batch_size = min(config.PREPROCESS_BATCH_SIZE, math.ceil(len(pairs) / num_processes))
+        batches = [pairs[i:i + batch_size] for i in range(0, len(pairs), batch_size)]
+
         print(f"Preprocessing {len(pairs)} audio files using {num_processes} processes...")
 
-        with mp.Pool(processes=num_processes) as pool:
-            results = pool.starmap(preprocess_single_audio, pairs)
+        # The work runs in the FFmpeg subprocesses, so threads are enough to
+        # drive them and nothing has to fork the (possibly multi-threaded)
+        # pipeline process
+        with ThreadPool(processes=num_processes) as pool:
+            results = [ok for batch in pool.map(preprocess_audio_batch, batches) for ok in batch]
     else:
         # Sequential processing
         print(f"Preprocessing {len(pairs)} audio files sequentially...")
-        results = [preprocess_single_audio(inp, out) for inp, out in pairs]
+        batch_size = config.PREPROCESS_BATCH_SIZE
+        results = []
+        for i in range(0, len(pairs), batch_size):
+            results.extend(preprocess_audio_batch(pairs[i:i + batch_size]))
 
     # Return successful outputs
     successful_outputs = [
@@ -107,6 +296,10 @@ def preprocess_audio_files(audio_files: List[Path], output_dir: Path,
 
     print(f"✓ Successfully preprocessed {len(successful_outputs)}/{len(pairs)} files")
 
+    # Record durations so later stages don't have to probe each file again
+    utils.save_json_data(measure_durations(successful_outputs),
+                         output_dir / config.DURATIONS_FILE_NAME)
+
     return successful_outputs
 
 
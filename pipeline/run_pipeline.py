@@ -16,9 +16,14 @@ Usage:
 """
 
 import argparse
+import os
+import queue
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional
 import time
 
 import config
@@ -26,22 +31,21 @@ import utils
 import preprocess_audio
 import transcribe
 import merge_outputs
+import _profile
 
 
-def process_session(session_info: dict, cleanup: bool = True) -> bool:
+def _prepare_session(session_info: dict) -> Optional[dict]:
     """
-    Process a single session.
+    Run the CPU-bound front half of a session: file matching and preprocessing.
 
     Args:
         session_info: Session information dict from utils.detect_session_structure()
-        cleanup: Whether to delete intermediate files after processing
 
     Returns:
-        True if successful, False otherwise
+        Session state dict for the later stages, or None if the session failed
     """
     session_name = session_info['name']
     session_path = session_info['path']
-    video_file = session_info['video_file']
 
     print(f"\n{'=' * 80}")
     print(f"Processing session: {session_name}")
@@ -59,7 +63,7 @@ def process_session(session_info: dict, cleanup: bool = True) -> bool:
 
     if not paired_files and not orphaned_files:
         print("  ✗ No audio files found in session!")
-        return False
+        return None
 
     all_audio_files = [f['audio'] for f in paired_files] + orphaned_files
 
@@ -76,20 +80,82 @@ def process_session(session_info: dict, cleanup: bool = True) -> bool:
 
     if not preprocessed_files:
         print("  ✗ Audio preprocessing failed!")
-        return False
+        return None
+
+    return {
+        'session_info': session_info,
+        'start_time': start_time,
+        'paired_files': paired_files,
+        'orphaned_files': orphaned_files,
+        'normalized_dir': normalized_dir,
+        'preprocessed_files': preprocessed_files,
+        'output_dir': session_path / config.OUTPUT_DIR_NAME
+    }
+
+
+def _transcribe_session(state: dict,
+                        transcriber: transcribe.WhisperTranscriber = None) -> Optional[dict]:
+    """
+    Transcribe a prepared session's audio (Step 3).
+
+    Args:
+        state: Session state from _prepare_session()
+        transcriber: Transcriber to reuse (a new one is created if None)
 
-    # Step 3: Transcribe with Whisper
+    Returns:
+        Dictionary mapping filename stems to Whisper results, or None if it failed
+    """
     print("\nStep 3: Transcribing audio with Whisper...")
     # Create output dir inside the session folder
-    output_dir = session_path / config.OUTPUT_DIR_NAME
+    output_dir = state['output_dir']
     utils.ensure_dir(output_dir)
 
-    transcriber = transcribe.WhisperTranscriber(config.WHISPER_MODEL)
-    transcripts = transcriber.transcribe_files(preprocessed_files, output_dir)
+    if transcriber is None:
+        transcriber = transcribe.WhisperTranscriber(config.WHISPER_MODEL)
+    transcripts = transcriber.transcribe_files(state['preprocessed_files'], output_dir)
 
     if not transcripts:
         print("  ✗ Transcription failed!")
-        return False
+        return None
+
+    return transcripts
+
+
+def _write_session_outputs(state: dict, transcripts: dict, cleanup: bool = True) -> bool:
+    """
+    Write all output files of a transcribed session and clean up (Steps 4-9).
+
+    Args:
+        state: Session state from _prepare_session()
+        transcripts: Transcripts from _transcribe_session()
+        cleanup: Whether to delete intermediate files after processing
+
+    Returns:
+        True if successful
+    """
+    session_name = state['session_info']['name']
+    video_file = state['session_info']['video_file']
+    start_time = state['start_time']
+    paired_files = state['paired_files']
+    orphaned_files = state['orphaned_files']
+    normalized_dir = state['normalized_dir']
+    output_dir = state['output_dir']
+
+    # Single timestamp so all outputs of this session carry the same date
+    processing_timestamp = datetime.now()
+
+    # Per-recording annotations shared by the individual, TXT and JSON outputs
+    annotations = None
+    if (config.GENERATE_INDIVIDUAL_TRANSCRIPTS or config.GENERATE_COMBINED_TXT
+            or config.GENERATE_COMBINED_JSON):
+        annotations = _profile.profile_call(
+            "build_annotations",
+            output_dir,
+            merge_outputs.build_annotations,
+            paired_files,
+            orphaned_files,
+            transcripts
+        )
 
     # Step 4: Generate individual transcript files
     if config.GENERATE_INDIVIDUAL_TRANSCRIPTS:
@@ -98,7 +164,8 @@ def process_session(session_info: dict, cleanup: bool = True) -> bool:
             paired_files,
             orphaned_files,
             transcripts,
-            output_dir
+            output_dir,
+            annotations=annotations
         )
         print(f"  ✓ Individual transcripts saved to: {output_dir / 'transcripts'}")
 
@@ -112,7 +179,9 @@ def process_session(session_info: dict, cleanup: bool = True) -> bool:
             transcripts,
             session_name,
             video_file,
-            txt_file
+            txt_file,
+            annotations=annotations,
+            processing_timestamp=processing_timestamp
         )
         print(f"  ✓ Combined TXT saved to: {txt_file}")
 
@@ -126,7 +195,9 @@ def process_session(session_info: dict, cleanup: bool = True) -> bool:
             transcripts,
             session_name,
             video_file,
-            json_file
+            json_file,
+            annotations=annotations,
+            processing_timestamp=processing_timestamp
         )
         print(f"  ✓ Combined JSON saved to: {json_file}")
 
@@ -153,7 +224,9 @@ def process_session(session_info: dict, cleanup: bool = True) -> bool:
             orphaned_files,
             transcripts,
             start_time,
-            report_file
+            report_file,
+            processing_timestamp=processing_timestamp,
+            annotations=annotations
         )
         print(f"  ✓ Processing report saved to: {report_file}")
 
@@ -173,18 +246,152 @@ def process_session(session_info: dict, cleanup: bool = True) -> bool:
     return True
 
 
+def process_session(session_info: dict, cleanup: bool = True,
+                    transcriber: transcribe.WhisperTranscriber = None) -> bool:
+    """
+    Process a single session.
+
+    Args:
+        session_info: Session information dict from utils.detect_session_structure()
+        cleanup: Whether to delete intermediate files after processing
+        transcriber: Transcriber to reuse, so its model is only loaded once
+            across sessions (a new one is created if None)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    state = _prepare_session(session_info)
+    if state is None:
+        return False
+
+    transcripts = _transcribe_session(state, transcriber)
+    if transcripts is None:
+        return False
+
+    return _write_session_outputs(state, transcripts, cleanup)
+
+
+def _report_session_error(session_info: dict, error: Exception) -> None:
+    """Print an unexpected error raised while processing a session."""
+    print(f"\n✗ Error processing session {session_info['name']}: {error}")
+    import traceback
+    traceback.print_exc()
+
+
+def process_sessions_pipelined(sessions: List[dict],
+                               transcriber: transcribe.WhisperTranscriber,
+                               cleanup: bool = True) -> int:
+    """
+    Process sessions with their stages overlapped across sessions.
+
+    A preprocessing thread prepares session N+1 while a transcription thread
+    holds the loaded model and transcribes session N; the calling thread
+    writes the outputs. At most two sessions are in flight, which bounds the
+    preprocessed audio kept on disk.
+
+    Args:
+        sessions: Session information dicts from utils.detect_session_structure()
+        transcriber: Transcriber shared by all sessions
+        cleanup: Whether to delete intermediate files after processing
+
+    Returns:
+        Number of successfully processed sessions
+    """
+    prepared = queue.Queue()
+    transcribed = queue.Queue()
+    in_flight = threading.Semaphore(2)
+
+    def preprocess_stage():
+        for session in sessions:
+            in_flight.acquire()
+            try:
+                state = _prepare_session(session)
+            except Exception as e:
+                _report_session_error(session, e)
+                state = None
+            if state is None:
+                in_flight.release()
+            else:
+                prepared.put(state)
+        prepared.put(None)
+
+    def transcribe_stage():
+        while True:
+            state = prepared.get()
+            if state is None:
+                break
+            try:
+                transcripts = _transcribe_session(state, transcriber)
+            except Exception as e:
+                _report_session_error(state['session_info'], e)
+                transcripts = None
+            if transcripts is None:
+                in_flight.release()
+            else:
+                transcribed.put((state, transcripts))
+        transcribed.put(None)
+
+    threads = [threading.Thread(target=preprocess_stage, daemon=True),
+               threading.Thread(target=transcribe_stage, daemon=True)]
+    for thread in threads:
+        thread.start()
+
+    success_count = 0
+    while True:
+        item = transcribed.get()
+        if item is None:
+            break
+        state, transcripts = item
+        try:
+            if _write_session_outputs(state, transcripts, cleanup):
+                success_count += 1
+        except Exception as e:
+            _report_session_error(state['session_info'], e)
+        finally:
+            in_flight.release()
+
+    for thread in threads:
+        thread.join()
+
+    return success_count
+
+
 def generate_processing_report(session_name: str, video_file: Path,
                                paired_files: list, orphaned_files: list,
                                transcripts: dict, start_time: float,
-                               output_file: Path) -> None:
+                               output_file: Path,
+                               processing_timestamp: datetime = None,
+                               annotations: list = None) -> None:
     """Generate processing report."""
     elapsed = time.time() - start_time
+    if processing_timestamp is None:
+        processing_timestamp = datetime.now()
 
     total_files = len(paired_files) + len(orphaned_files)
     successful = len(transcripts)
-    total_duration = sum(utils.get_audio_duration(f['audio']) for f in paired_files if f['audio'].stem in transcripts)
-    total_words = sum(utils.count_words(transcripts[f['audio'].stem]["text"]) for f in paired_files if f['audio'].stem in transcripts)
-    total_chars = sum(len(transcripts[f['audio'].stem]["text"]) for f in paired_files if f['audio'].stem in transcripts)
+
+    # Look up all paired durations at once; probes overlap while they wait on I/O
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        durations = list(executor.map(utils.get_audio_duration,
+                                      [f['audio'] for f in paired_files]))
+
+    # Totals over transcribed paired files; shortest/longest over all paired files
+    total_duration = 0.0
+    texts = []
+    shortest = longest = None
+    for file_info, duration in zip(paired_files, durations):
+        if shortest is None or duration < shortest[0]:
+            shortest = (duration, file_info['audio'].name)
+        if longest is None or duration > longest[0]:
+            longest = (duration, file_info['audio'].name)
+
+        result = transcripts.get(file_info['audio'].stem)
+        if result is not None:
+            total_duration += duration
+            texts.append(result["text"])
+
+    total_words = sum(map(utils.count_words, texts))
+    total_chars = sum(map(len, texts))
 
     # Calculate quality statistics
     total_segments = 0
@@ -193,126 +400,128 @@ def generate_processing_report(session_name: str, video_file: Path,
     segments_with_low_confidence = 0
     recordings_with_issues = 0
 
+    # Reuse the batch analyses already computed for the merged outputs
+    known_quality = {a.stem: a.segment_quality for a in annotations or ()}
+
     for file_stem in transcripts:
         result = transcripts[file_stem]
         segments = result.get("segments", [])
         total_segments += len(segments)
 
-        has_quality_issue = False
-        for segment in segments:
-            from merge_outputs import analyze_segment_quality, add_quality_flags
-            quality = analyze_segment_quality(segment)
-            quality = add_quality_flags(quality)
-
-            if quality['likely_hallucination']:
-                segments_with_hallucination += 1
-                has_quality_issue = True
-            if quality['likely_silence']:
-                segments_with_silence += 1
-                has_quality_issue = True
-            if quality['low_confidence']:
-                segments_with_low_confidence += 1
-                has_quality_issue = True
-
-        if has_quality_issue:
+        quality = known_quality.get(file_stem)
+        if quality is None:
+            quality = merge_outputs.analyze_segments_batch(segments)
+        hallucinations = int(quality['likely_hallucination'].sum())
+        silences = int(quality['likely_silence'].sum())
+        low_confidences = int(quality['low_confidence'].sum())
+
+        segments_with_hallucination += hallucinations
+        segments_with_silence += silences
+        segments_with_low_confidence += low_confidences
+
+        if hallucinations or silences or low_confidences:
             recordings_with_issues += 1
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("=" * 80 + "\n")
-        f.write("TRANSCRIPTION PROCESSING REPORT\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"Session: {session_name}\n")
-        f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Model: Whisper {config.WHISPER_MODEL} (244M parameters)\n")
-        f.write("=" * 80 + "\n\n")
-
-        f.write("FILES PROCESSED\n")
-        f.write("─" * 80 + "\n")
-        f.write(f"Total audio files found:        {total_files}\n")
-        f.write(f"With JSON timestamps:           {len(paired_files)}\n")
-        f.write(f"Orphaned (no JSON):             {len(orphaned_files)}\n")
-        f.write(f"Successfully transcribed:       {successful}\n")
-        f.write(f"Failed transcriptions:          {total_files - successful}\n")
-        f.write(f"Success rate:                   {100 * successful / total_files:.1f}%\n\n")
-
-        f.write("TIMING\n")
-        f.write("─" * 80 + "\n")
-        f.write(f"Total processing time:          {int(elapsed // 60)}m {int(elapsed % 60)}s\n")
-        if successful > 0:
-            f.write(f"Average per file:               {elapsed / successful:.1f}s\n")
-        if total_duration > 0:
-            f.write(f"Audio duration / processing:    {total_duration / elapsed:.2f}x (realtime)\n\n")
-
-        f.write("CONTENT STATISTICS\n")
-        f.write("─" * 80 + "\n")
-        f.write(f"Total audio duration:           {total_duration:.1f} seconds\n")
-        f.write(f"Total words transcribed:        {total_words}\n")
-        f.write(f"Total characters:               {total_chars:,}\n")
-        if successful > 0:
-            f.write(f"Average words per recording:    {total_words // successful}\n")
-
-        if paired_files:
-            durations = [utils.get_audio_duration(f['audio']) for f in paired_files]
-            f.write(f"Shortest recording:             {min(durations):.1f}s ({paired_files[durations.index(min(durations))]['audio'].name})\n")
-            f.write(f"Longest recording:              {max(durations):.1f}s ({paired_files[durations.index(max(durations))]['audio'].name})\n\n")
-
-        if paired_files and len(paired_files) > 0:
-            f.write("VIDEO COVERAGE\n")
-            f.write("─" * 80 + "\n")
-            first_ts = paired_files[0]['timestamp_sec']
-            last_ts = paired_files[-1]['timestamp_sec']
-            f.write(f"First annotation timestamp:     {utils.format_timestamp(first_ts)}\n")
-            f.write(f"Last annotation timestamp:      {utils.format_timestamp(last_ts)}\n")
-            f.write(f"Total video span covered:       {utils.format_timestamp(last_ts - first_ts, include_milliseconds=False)} ({last_ts - first_ts:.1f} seconds)\n\n")
-
-        f.write("OUTPUT FILES CREATED\n")
-        f.write("─" * 80 + "\n")
-        f.write(f"✓ {successful} individual transcript files (transcripts/*.txt)\n")
-        if config.GENERATE_COMBINED_TXT:
-            f.write(f"✓ combined_transcript.txt\n")
-        if config.GENERATE_COMBINED_JSON:
-            f.write(f"✓ combined_transcript.json\n")
-        if config.GENERATE_PLAIN_TEXT:
-            f.write(f"✓ plain_text_transcript.txt\n")
-        f.write(f"✓ processing_report.txt\n\n")
-
-        f.write("SYSTEM INFO\n")
-        f.write("─" * 80 + "\n")
-        import platform
-        import sys
-        f.write(f"Operating System: {platform.system()} {platform.release()}\n")
-        f.write(f"Python Version: {sys.version.split()[0]}\n")
-        f.write(f"Whisper Model: {config.WHISPER_MODEL}\n")
-        f.write(f"Pipeline Version: {config.PIPELINE_VERSION}\n\n")
-
-        if config.ENABLE_QUALITY_CHECKS and total_segments > 0:
-            f.write("QUALITY METRICS\n")
-            f.write("─" * 80 + "\n")
-            f.write(f"Total segments analyzed:        {total_segments}\n")
-            f.write(f"Segments with hallucination:    {segments_with_hallucination} ({100 * segments_with_hallucination / total_segments:.1f}%)\n")
-            f.write(f"Segments with silence:          {segments_with_silence} ({100 * segments_with_silence / total_segments:.1f}%)\n")
-            f.write(f"Segments with low confidence:   {segments_with_low_confidence} ({100 * segments_with_low_confidence / total_segments:.1f}%)\n")
-            f.write(f"Recordings with quality issues: {recordings_with_issues} ({100 * recordings_with_issues / successful:.1f}%)\n\n")
-
-            f.write("QUALITY THRESHOLDS\n")
-            f.write("─" * 80 + "\n")
-            f.write(f"Compression ratio threshold:    {config.COMPRESSION_RATIO_THRESHOLD} (hallucination detector)\n")
-            f.write(f"No-speech probability threshold: {config.NO_SPEECH_THRESHOLD} (silence detector)\n")
-            f.write(f"Confidence threshold:           {config.CONFIDENCE_THRESHOLD} (low confidence)\n\n")
-
-        f.write("QUALITY NOTES\n")
-        f.write("─" * 80 + "\n")
-        f.write("- All transcriptions include verbatim speech (filler words preserved)\n")
-        f.write(f"- Temperature: {config.TEMPERATURE} (deterministic, reproducible)\n")
-        f.write(f"- Language: {config.LANGUAGE} (forced)\n")
-        f.write("- No post-processing or correction applied\n")
-        if config.ENABLE_QUALITY_CHECKS:
-            f.write("- Quality checks enabled (hallucination & silence detection)\n")
-        f.write("\n")
-
-        f.write("=" * 80 + "\n")
-        f.write("END OF REPORT\n")
-        f.write("=" * 80 + "\n")
+    # Collect the report and write it in one go
+    parts = []
+    w = parts.append
+
+    w("=" * 80 + "\n")
+    w("TRANSCRIPTION PROCESSING REPORT\n")
+    w("=" * 80 + "\n")
+    w(f"Session: {session_name}\n")
+    w(f"Date: {processing_timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w(f"Model: Whisper {config.WHISPER_MODEL} (244M parameters)\n")
+    w("=" * 80 + "\n\n")
+
+    w("FILES PROCESSED\n")
+    w("─" * 80 + "\n")
+    w(f"Total audio files found:        {total_files}\n")
+    w(f"With JSON timestamps:           {len(paired_files)}\n")
+    w(f"Orphaned (no JSON):             {len(orphaned_files)}\n")
+    w(f"Successfully transcribed:       {successful}\n")
+    w(f"Failed transcriptions:          {total_files - successful}\n")
+    w(f"Success rate:                   {100 * successful / total_files:.1f}%\n\n")
+
+    w("TIMING\n")
+    w("─" * 80 + "\n")
+    w(f"Total processing time:          {int(elapsed // 60)}m {int(elapsed % 60)}s\n")
+    if successful > 0:
+        w(f"Average per file:               {elapsed / successful:.1f}s\n")
+    if total_duration > 0:
+        w(f"Audio duration / processing:    {total_duration / elapsed:.2f}x (realtime)\n\n")
+
+    w("CONTENT STATISTICS\n")
+    w("─" * 80 + "\n")
+    w(f"Total audio duration:           {total_duration:.1f} seconds\n")
+    w(f"Total words transcribed:        {total_words}\n")
+    w(f"Total characters:               {total_chars:,}\n")
+    if successful > 0:
+        w(f"Average words per recording:    {total_words // successful}\n")
+
+    if paired_files:
+        w(f"Shortest recording:             {shortest[0]:.1f}s ({shortest[1]})\n")
+        w(f"Longest recording:              {longest[0]:.1f}s ({longest[1]})\n\n")
+
+    if paired_files and len(paired_files) > 0:
+        w("VIDEO COVERAGE\n")
+        w("─" * 80 + "\n")
+        first_ts = paired_files[0]['timestamp_sec']
+        last_ts = paired_files[-1]['timestamp_sec']
+        w(f"First annotation timestamp:     {utils.format_timestamp(first_ts)}\n")
+        w(f"Last annotation timestamp:      {utils.format_timestamp(last_ts)}\n")
+        w(f"Total video span covered:       {utils.format_timestamp(last_ts - first_ts, include_milliseconds=False)} ({last_ts - first_ts:.1f} seconds)\n\n")
+
+    w("OUTPUT FILES CREATED\n")
+    w("─" * 80 + "\n")
+    w(f"✓ {successful} individual transcript files (transcripts/*.txt)\n")
+    if config.GENERATE_COMBINED_TXT:
+        w(f"✓ combined_transcript.txt\n")
+    if config.GENERATE_COMBINED_JSON:
+        w(f"✓ combined_transcript.json\n")
+    if config.GENERATE_PLAIN_TEXT:
+        w(f"✓ plain_text_transcript.txt\n")
+    w(f"✓ processing_report.txt\n\n")
+
+    w("SYSTEM INFO\n")
+    w("─" * 80 + "\n")
+    import platform
+    import sys
+    w(f"Operating System: {platform.system()} {platform.release()}\n")
+    w(f"Python Version: {sys.version.split()[0]}\n")
+    w(f"Whisper Model: {config.WHISPER_MODEL}\n")
+    w(f"Pipeline Version: {config.PIPELINE_VERSION}\n\n")
+
+    if config.ENABLE_QUALITY_CHECKS and total_segments > 0:
+        w("QUALITY METRICS\n")
+        w("─" * 80 + "\n")
+        w(f"Total segments analyzed:        {total_segments}\n")
+        w(f"Segments with hallucination:    {segments_with_hallucination} ({100 * segments_with_hallucination / total_segments:.1f}%)\n")
+        w(f"Segments with silence:          {segments_with_silence} ({100 * segments_with_silence / total_segments:.1f}%)\n")
+        w(f"Segments with low confidence:   {segments_with_low_confidence} ({100 * segments_with_low_confidence / total_segments:.1f}%)\n")
+        w(f"Recordings with quality issues: {recordings_with_issues} ({100 * recordings_with_issues / successful:.1f}%)\n\n")
+
+        w("QUALITY THRESHOLDS\n")
+        w("─" * 80 + "\n")
+        w(f"Compression ratio threshold:    {config.COMPRESSION_RATIO_THRESHOLD} (hallucination detector)\n")
+        w(f"No-speech probability threshold: {config.NO_SPEECH_THRESHOLD} (silence detector)\n")
+        w(f"Confidence threshold:           {config.CONFIDENCE_THRESHOLD} (low confidence)\n\n")
+
+    w("QUALITY NOTES\n")
+    w("─" * 80 + "\n")
+    w("- All transcriptions include verbatim speech (filler words preserved)\n")
+    w(f"- Temperature: {config.TEMPERATURE} (deterministic, reproducible)\n")
+    w(f"- Language: {config.LANGUAGE} (forced)\n")
+    w("- No post-processing or correction applied\n")
+    if config.ENABLE_QUALITY_CHECKS:
+        w("- Quality checks enabled (hallucination & silence detection)\n")
+    w("\n")
+
+    w("=" * 80 + "\n")
+    w("END OF REPORT\n")
+    w("=" * 80 + "\n")
+
+    output_file.write_text(''.join(parts), encoding='utf-8')
 
 
 def main():
@@ -397,14 +606,21 @@ Output is always placed in a 'transcripts/' subfolder within each session folder
     cleanup = not args.no_cleanup
     success_count = 0
 
-    for session in sessions:
-        try:
-            if process_session(session, cleanup=cleanup):
-                success_count += 1
-        except Exception as e:
-            print(f"\n✗ Error processing session {session['name']}: {e}")
-            import traceback
-            traceback.print_exc()
+    # One transcriber for all sessions; its model loads on first use and stays loaded
+    transcriber = transcribe.WhisperTranscriber(config.WHISPER_MODEL)
+
+    # Only worth it when transcription runs on the GPU; on CPU the stages
+    # would just compete for the same cores
+    if config.OVERLAP_SESSIONS and len(sessions) > 1 and transcriber.device == "cuda":
+        # Preprocess the next session while the current one is transcribed
+        success_count = process_sessions_pipelined(sessions, transcriber, cleanup=cleanup)
+    else:
+        for session in sessions:
+            try:
+                if process_session(session, cleanup=cleanup, transcriber=transcriber):
+                    success_count += 1
+            except Exception as e:
+                _report_session_error(session, e)
 
     # Summary
     print(f"\n{'=' * 80}")
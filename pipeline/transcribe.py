@@ -4,9 +4,11 @@ Transcription module using OpenAI Whisper.
 This module handles loading the Whisper model and transcribing audio files.
 """
 
+import wave
 from pathlib import Path
 from typing import List, Dict, Optional
 
+import numpy as np
 import torch
 import whisper
 
@@ -14,6 +16,104 @@ import config
 import utils
 
 
+# Sample rate Whisper models expect
+_WHISPER_SAMPLE_RATE = 16000
+
+
+def _read_pcm_wav(audio_file: Path) -> Optional[np.ndarray]:
+    """
+    Read a preprocessed WAV file into a float32 waveform.
+
+    Only 16-bit mono PCM at 16 kHz is read (the preprocessing output format);
+    samples are scaled exactly like Whisper's own ffmpeg-based loader.
+
+    Args:
+        audio_file: Path to audio file
+
+    Returns:
+        Waveform in [-1, 1), or None if the file isn't in that format
+    """
+    if audio_file.suffix.lower() != '.wav':
+        return None
+    try:
+        with wave.open(str(audio_file), 'rb') as wav:
+            if (wav.getsampwidth() != 2 or wav.getnchannels() != 1
+                    or wav.getframerate() != _WHISPER_SAMPLE_RATE):
+                return None
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError, OSError):
+        return None
+    return np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768.0
+
+
+def _chunk_audio(audio: np.ndarray, sample_rate: int, max_sec: float,
+                 search_sec: float = 5.0, min_tail_sec: float = 30.0) -> List[int]:
+    """
+    Choose where to split a long waveform into windows of about max_sec seconds.
+
+    Each cut is placed at the quietest 20 ms frame within the last search_sec
+    seconds before the window limit, so cuts fall in pauses rather than
+    mid-word. A final window shorter than min_tail_sec is folded into the
+    previous one (which may then exceed max_sec), since Whisper tends to
+    hallucinate on short, heavily padded input.
+
+    Args:
+        audio: Waveform array
+        sample_rate: Sample rate of the waveform
+        max_sec: Target window length in seconds
+        search_sec: Length of the region searched for a quiet cut point
+        min_tail_sec: Minimum length of the final window in seconds
+
+    Returns:
+        Start sample of each window, in order (the first is always 0)
+    """
+    max_len = int(max_sec * sample_rate)
+    search = min(int(search_sec * sample_rate), max_len // 2)
+    frame = sample_rate // 50
+    min_tail = int(min_tail_sec * sample_rate)
+
+    starts = [0]
+    while len(audio) - starts[-1] > max_len:
+        end = starts[-1] + max_len
+        frames = audio[end - search:end - search % frame].reshape(-1, frame)
+        energy = np.square(frames, dtype=np.float64).sum(axis=1)
+        cut = end - search + int(np.argmin(energy)) * frame + frame // 2
+        if len(audio) - cut < min_tail:
+            break
+        starts.append(cut)
+    return starts
+
+
+def _merge_chunk_results(results: List[Dict], offsets: List[float]) -> Dict:
+    """
+    Combine the Whisper results of consecutive audio windows into one result.
+
+    Segment times (and seek positions) are shifted by each window's offset
+    and segment ids are renumbered, so the result looks like a single pass.
+
+    Args:
+        results: Whisper result dictionaries, one per window, in order
+        offsets: Start time of each window in seconds
+
+    Returns:
+        Whisper result dictionary with text, segments, and language
+    """
+    segments = []
+    for result, offset in zip(results, offsets):
+        for segment in result["segments"]:
+            segment = dict(segment)
+            segment["id"] = len(segments)
+            segment["seek"] += int(round(offset * 100))  # seek is in 10 ms mel frames
+            segment["start"] += offset
+            segment["end"] += offset
+            segments.append(segment)
+    return {
+        "text": "".join(result["text"] for result in results),
+        "segments": segments,
+        "language": results[0]["language"],
+    }
+
+
 class WhisperTranscriber:
     """Wrapper class for Whisper transcription."""
 
@@ -36,8 +136,71 @@ class WhisperTranscriber:
             print(f"Loading Whisper model '{self.model_name}' on {self.device}...")
             print("(This may take a moment on first run while downloading the model)")
             self.model = whisper.load_model(self.model_name, device=self.device)
+            if self.device == "cuda":
+                # Build the mel filterbank on the GPU once. Whisper caches it
+                # per device argument and later passes the waveform's
+                # torch.device ("cuda:<index>"), so warm up with that key.
+                device = torch.device(self.device, torch.cuda.current_device())
+                whisper.audio.mel_filters(device, self.model.dims.n_mels)
             print("✓ Model loaded successfully")
 
+    def _load_audio(self, audio_file: Path):
+        """
+        Prepare an audio file as model input.
+
+        Preprocessed WAV files are read in-process, so Whisper doesn't have to
+        launch ffmpeg to decode them again; other files are passed by path
+        (or, on CUDA, decoded by Whisper so the waveform can be moved to the
+        GPU).
+
+        Args:
+            audio_file: Path to audio file
+
+        Returns:
+            Waveform array, or the file path as a string
+        """
+        audio = _read_pcm_wav(audio_file)
+        if audio is None and self.device == "cuda":
+            audio = whisper.load_audio(str(audio_file))
+        return audio if audio is not None else str(audio_file)
+
+    def _transcribe_whisper(self, audio, initial_prompt: Optional[str] = None) -> Dict:
+        """Run Whisper on a waveform or file path."""
+        if self.device == "cuda" and not isinstance(audio, str):
+            # Whisper then computes the STFT and mel spectrogram on the GPU
+            audio = torch.from_numpy(audio).to(self.device)
+        return self.model.transcribe(
+            audio,
+            language=config.LANGUAGE,
+            task=config.TASK,
+            temperature=config.TEMPERATURE,
+            verbose=config.VERBOSE,
+            word_timestamps=False,  # We have video timestamps already
+            initial_prompt=initial_prompt,
+        )
+
+    def _transcribe_windows(self, audio: np.ndarray, max_sec: float) -> Dict:
+        """
+        Transcribe a long waveform window by window.
+
+        Each window is prompted with the previous window's text, so decoding
+        keeps its context across the cuts.
+
+        Args:
+            audio: Waveform array
+            max_sec: Target window length in seconds
+
+        Returns:
+            Whisper result dictionary with text, segments, and language
+        """
+        starts = _chunk_audio(audio, _WHISPER_SAMPLE_RATE, max_sec)
+        ends = starts[1:] + [len(audio)]
+        results = []
+        for start, end in zip(starts, ends):
+            prompt = results[-1]["text"] if results else None
+            results.append(self._transcribe_whisper(audio[start:end], initial_prompt=prompt))
+        return _merge_chunk_results(results, [start / _WHISPER_SAMPLE_RATE for start in starts])
+
     def transcribe_file(self, audio_file: Path) -> Optional[Dict]:
         """
         Transcribe a single audio file.
@@ -53,18 +216,14 @@ class WhisperTranscriber:
             self.load_model()
 
         try:
-            # Transcribe with Whisper
-            result = self.model.transcribe(
-                str(audio_file),
-                language=config.LANGUAGE,
-                task=config.TASK,
-                temperature=config.TEMPERATURE,
-                verbose=config.VERBOSE,
-                word_timestamps=False,  # We have video timestamps already
-            )
+            audio = self._load_audio(audio_file)
+            max_sec = config.MAX_CLIP_SECONDS
+            if (max_sec and not isinstance(audio, str)
+                    and len(audio) > max_sec * _WHISPER_SAMPLE_RATE):
+                return self._transcribe_windows(audio, max_sec)
 
             # Return full result with text, segments, and language
-            return result
+            return self._transcribe_whisper(audio)
 
         except Exception as e:
             print(f"Error transcribing {audio_file.name}: {e}")
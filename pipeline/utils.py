@@ -7,12 +7,73 @@ and other common operations used throughout the pipeline.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
 import config
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard library json module
+    orjson = None
+
+if orjson is not None:
+    # NumPy arrays and scalars are serialized natively, without .tolist(), and
+    # non-string dict keys are stringified like the json module does
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _parse_json_bytes(raw: bytes):
+    """Parse JSON from raw bytes, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals; retry with stdlib json
+    return json.loads(raw)
+
+
+# Video formats recognized in a session folder, in order of preference
+_VIDEO_EXTENSIONS = ('.mkv', '.mp4', '.avi', '.mov')
+
+
+def _scan_directory(directory: Path) -> Tuple[List[Path], Optional[Path], Dict[str, os.DirEntry]]:
+    """
+    List a directory once and pick out its audio and video files.
+
+    Matches what per-extension globbing would find (dot-prefixed files
+    included, config.IGNORE_FILES filtered out) without a directory scan per
+    extension.
+    The returned os.DirEntry objects cache their stat() result.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Tuple of (audio_files, video_file or None, entries by name)
+    """
+    audio_extensions = set(config.AUDIO_EXTENSIONS)
+    ignore_files = set(config.IGNORE_FILES)
+
+    audio_files = []
+    videos = {}
+    entries = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            entries[name] = entry
+            path = directory / name
+            suffix = path.suffix
+            if suffix in audio_extensions and name not in ignore_files:
+                audio_files.append(path)
+            elif suffix in _VIDEO_EXTENSIONS:
+                videos.setdefault(suffix, path)
+
+    video_file = next((videos[ext] for ext in _VIDEO_EXTENSIONS if ext in videos), None)
+    return audio_files, video_file, entries
+
 
 def find_audio_json_pairs(session_dir: Path) -> Tuple[List[Dict], List[Path]]:
     """
@@ -29,16 +90,8 @@ def find_audio_json_pairs(session_dir: Path) -> Tuple[List[Dict], List[Path]]:
     paired_files = []
     orphaned_files = []
 
-    # Find all audio files
-    audio_files = []
-    for ext in config.AUDIO_EXTENSIONS:
-        audio_files.extend(session_dir.glob(f"*{ext}"))
-
-    # Filter out ignored files
-    audio_files = [
-        f for f in audio_files
-        if f.name not in config.IGNORE_FILES
-    ]
+    # Find all audio files (and every entry name) in one directory pass
+    audio_files, _, entries = _scan_directory(session_dir)
 
     # Match with JSON files
     for audio_file in audio_files:
@@ -48,12 +101,11 @@ def find_audio_json_pairs(session_dir: Path) -> Tuple[List[Dict], List[Path]]:
         # Look for matching JSON file
         json_file = session_dir / f"{base_name}{config.JSON_EXTENSION}"
 
-        if json_file.exists():
+        if json_file.name in entries:
             # Read timestamp from JSON
             try:
-                with open(json_file, 'r') as f:
-                    json_data = json.load(f)
-                    timestamp_sec = json_data.get('video_timestamp_sec', None)
+                json_data = _parse_json_bytes(json_file.read_bytes())
+                timestamp_sec = json_data.get('video_timestamp_sec', None)
 
                 paired_files.append({
                     'audio': audio_file,
@@ -70,12 +122,13 @@ def find_audio_json_pairs(session_dir: Path) -> Tuple[List[Dict], List[Path]]:
     # Sort paired files by timestamp
     paired_files.sort(key=lambda x: x['timestamp_sec'] if x['timestamp_sec'] is not None else float('inf'))
 
-    # Sort orphaned files by creation time
-    orphaned_files.sort(key=lambda x: x.stat().st_ctime)
+    # Sort orphaned files by creation time (stat cached on the scanned entries)
+    orphaned_files.sort(key=lambda x: entries[x.name].stat().st_ctime)
 
     return paired_files, orphaned_files
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(seconds: float, include_milliseconds: bool = True) -> str:
     """
     Convert seconds to HH:MM:SS.mmm format.
@@ -87,20 +140,74 @@ def format_timestamp(seconds: float, include_milliseconds: bool = True) -> str:
     Returns:
         Formatted timestamp string
     """
-    td = timedelta(seconds=seconds)
-    hours = int(td.total_seconds() // 3600)
-    minutes = int((td.total_seconds() % 3600) // 60)
-    secs = td.total_seconds() % 60
+    # Plain divmod arithmetic; no timedelta object per call
+    hours, remainder = divmod(float(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
 
     if include_milliseconds:
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        return f"{int(hours):02d}:{int(minutes):02d}:{secs:06.3f}"
     else:
-        return f"{hours:02d}:{minutes:02d}:{int(secs):02d}"
+        return f"{int(hours):02d}:{int(minutes):02d}:{int(secs):02d}"
+
+
+@lru_cache(maxsize=None)
+def _load_duration_sidecar(sidecar_file: Path) -> Dict[str, float]:
+    """Load a durations sidecar written during preprocessing (empty if absent)."""
+    if not sidecar_file.exists():
+        return {}
+    return load_json_data(sidecar_file) or {}
 
 
+def _wav_header_duration(audio_file: Path) -> Optional[float]:
+    """
+    Read a WAV file's duration from its RIFF headers.
+
+    Walks the chunk list up to the 'data' chunk and divides its size by the
+    byte rate from the 'fmt ' chunk, so only a few header bytes are read.
+
+    Args:
+        audio_file: Path to a .wav file
+
+    Returns:
+        Duration in seconds, or None if the headers can't be interpreted
+    """
+    try:
+        with open(audio_file, 'rb') as f:
+            riff = f.read(12)
+            if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:] != b'WAVE':
+                return None
+
+            byte_rate = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                chunk_id = header[:4]
+                chunk_size = int.from_bytes(header[4:], 'little')
+
+                if chunk_id == b'fmt ':
+                    fmt = f.read(chunk_size + (chunk_size & 1))
+                    byte_rate = int.from_bytes(fmt[8:12], 'little')
+                elif chunk_id == b'data':
+                    if not byte_rate:
+                        return None
+                    # Streamed writers may leave a placeholder size; clamp to the file
+                    remaining = os.fstat(f.fileno()).st_size - f.tell()
+                    return min(chunk_size, remaining) / byte_rate
+                else:
+                    f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
 def get_audio_duration(audio_file: Path) -> float:
     """
-    Get the duration of an audio file in seconds using FFmpeg.
+    Get the duration of an audio file in seconds.
+
+    Uses the durations sidecar recorded during preprocessing when available,
+    then the RIFF headers for .wav files, and otherwise falls back to FFmpeg.
+    Results are cached per file.
 
     Args:
         audio_file: Path to audio file (any format supported by FFmpeg)
@@ -108,6 +215,16 @@ def get_audio_duration(audio_file: Path) -> float:
     Returns:
         Duration in seconds
     """
+    sidecar_file = audio_file.parent / config.PROCESSED_DIR_NAME / config.DURATIONS_FILE_NAME
+    duration = _load_duration_sidecar(sidecar_file).get(audio_file.stem)
+    if duration is not None:
+        return float(duration)
+
+    if audio_file.suffix.lower() == '.wav':
+        duration = _wav_header_duration(audio_file)
+        if duration is not None:
+            return duration
+
     try:
         import subprocess
         import json
@@ -145,6 +262,7 @@ def count_words(text: str) -> int:
     return len(text.split())
 
 
+@lru_cache(maxsize=None)
 def get_file_creation_time(file_path: Path) -> str:
     """
     Get file creation time as formatted string.
@@ -184,22 +302,10 @@ def detect_session_structure(input_dir: Path) -> Tuple[str, List[Dict]]:
         raise NotADirectoryError(f"Input path is not a directory: {input_dir}")
 
     # Check for audio files directly in input_dir
-    audio_files_here = []
-    for ext in config.AUDIO_EXTENSIONS:
-        audio_files_here.extend(input_dir.glob(f"*{ext}"))
-
-    # Filter out ignored files
-    audio_files_here = [f for f in audio_files_here if f.name not in config.IGNORE_FILES]
+    audio_files_here, video_file, entries = _scan_directory(input_dir)
 
     if audio_files_here:
         # Single session mode - audio files found directly
-        video_file = None
-        for ext in ['.mkv', '.mp4', '.avi', '.mov']:
-            potential_videos = list(input_dir.glob(f"*{ext}"))
-            if potential_videos:
-                video_file = potential_videos[0]
-                break
-
         session = {
             'name': input_dir.name,
             'path': input_dir,
@@ -209,29 +315,22 @@ def detect_session_structure(input_dir: Path) -> Tuple[str, List[Dict]]:
 
     # No audio files at top level, check subdirectories
     sessions = []
-    for item in input_dir.iterdir():
-        if item.is_dir() and item.name not in [config.PROCESSED_DIR_NAME, config.OUTPUT_DIR_NAME]:
-            # Check if this subfolder has audio files
-            audio_in_subdir = []
-            for ext in config.AUDIO_EXTENSIONS:
-                audio_in_subdir.extend(item.glob(f"*{ext}"))
-
-            audio_in_subdir = [f for f in audio_in_subdir if f.name not in config.IGNORE_FILES]
-
-            if audio_in_subdir:
-                # Found a session subfolder
-                video_file = None
-                for ext in ['.mkv', '.mp4', '.avi', '.mov']:
-                    potential_videos = list(item.glob(f"*{ext}"))
-                    if potential_videos:
-                        video_file = potential_videos[0]
-                        break
-
-                sessions.append({
-                    'name': item.name,
-                    'path': item,
-                    'video_file': video_file
-                })
+    # Reuse the listing above rather than scanning input_dir a second time
+    skip_dirs = {config.PROCESSED_DIR_NAME, config.OUTPUT_DIR_NAME}
+    subdirs = [input_dir / name for name, entry in entries.items()
+               if name not in skip_dirs and entry.is_dir()]
+
+    for item in subdirs:
+        # Check if this subfolder has audio files
+        audio_in_subdir, video_file, _ = _scan_directory(item)
+
+        if audio_in_subdir:
+            # Found a session subfolder
+            sessions.append({
+                'name': item.name,
+                'path': item,
+                'video_file': video_file
+            })
 
     if sessions:
         # Multiple sessions mode
@@ -271,6 +370,10 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+# Characters invalid in filenames, each mapped to an underscore
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename by removing invalid characters.
@@ -281,10 +384,7 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(_SANITIZE_TABLE)
 
 
 def load_json_data(json_file: Path) -> Optional[Dict]:
@@ -298,8 +398,7 @@ def load_json_data(json_file: Path) -> Optional[Dict]:
         Parsed JSON data or None if error
     """
     try:
-        with open(json_file, 'r') as f:
-            return json.load(f)
+        return _parse_json_bytes(Path(json_file).read_bytes())
     except Exception as e:
         print(f"Error loading {json_file}: {e}")
         return None
@@ -317,6 +416,16 @@ def save_json_data(data: Dict, output_file: Path) -> bool:
         True if successful, False otherwise
     """
     try:
+        if orjson is not None:
+            try:
+                # Serialize in one call and write the bytes in one go
+                Path(output_file).write_bytes(
+                    orjson.dumps(data, option=_ORJSON_OPTIONS, default=str)
+                )
+                return True
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits; retry with stdlib json
+
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
         return True
@@ -325,6 +434,88 @@ def save_json_data(data: Dict, output_file: Path) -> bool:
         return False
 
 
+def _dump_json_bytes(value, indent: bytes = b"") -> bytes:
+    """Serialize one value as pretty-printed UTF-8 JSON nested at the given indent."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(value, option=_ORJSON_OPTIONS, default=str)
+        except orjson.JSONEncodeError:
+            encoded = json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        encoded = json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+    # JSON strings never contain raw newlines, so this only re-indents structure
+    return encoded.replace(b"\n", b"\n" + indent) if indent else encoded
+
+
+def dumps_json(data) -> str:
+    """Serialize data to the same pretty-printed JSON text save_json_data() writes."""
+    return _dump_json_bytes(data).decode('utf-8')
+
+
+class StreamingJsonWriter:
+    """
+    Incremental writer for a pretty-printed JSON object.
+
+    Top-level keys are written one at a time and list values can be emitted
+    item by item, so large documents never have to be serialized (or even
+    built) in full. The output has the same layout as save_json_data().
+
+    Usage:
+        with StreamingJsonWriter(output_file) as writer:
+            writer.write_field("metadata", metadata)
+            writer.begin_list("items")
+            for item in items:
+                writer.write_item(item)
+            writer.end_list()
+    """
+
+    def __init__(self, output_file: Path, buffering: int = config.IO_BUFFER_SIZE):
+        self.output_file = output_file
+        self.buffering = buffering
+        self._file = None
+        self._field_count = 0
+        self._item_count = 0
+
+    def __enter__(self) -> "StreamingJsonWriter":
+        self._file = open(self.output_file, 'wb', buffering=self.buffering)
+        self._file.write(b"{")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self._file.write(b"\n}" if self._field_count else b"}")
+        finally:
+            self._file.close()
+
+    def _write_key(self, key: str) -> None:
+        self._file.write(b",\n  " if self._field_count else b"\n  ")
+        self._file.write(_dump_json_bytes(key) + b": ")
+        self._field_count += 1
+
+    def write_field(self, key: str, value) -> None:
+        """Write one complete top-level field."""
+        self._write_key(key)
+        self._file.write(_dump_json_bytes(value, b"  "))
+
+    def begin_list(self, key: str) -> None:
+        """Start a top-level list field whose items follow via write_item()."""
+        self._write_key(key)
+        self._file.write(b"[")
+        self._item_count = 0
+
+    def write_item(self, item) -> None:
+        """Append one item to the open list."""
+        self._file.write(b",\n    " if self._item_count else b"\n    ")
+        self._file.write(_dump_json_bytes(item, b"    "))
+        self._item_count += 1
+
+    def end_list(self) -> None:
+        """Close the open list field."""
+        self._file.write(b"\n  ]" if self._item_count else b"]")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Convert bytes to human-readable format.